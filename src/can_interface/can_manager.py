@@ -39,6 +39,7 @@ class CANInterfaceManager(QObject):
         self.bitrate: int = 500000
         self.is_connected: bool = False
         self._listener_thread: Optional[QThread] = None
+        self._rx_listeners: List[Callable[[can.Message], None]] = []
         
     def connect(self, interface: str, channel: str, bitrate: int = 500000, 
                 **kwargs) -> bool:
@@ -70,7 +71,7 @@ class CANInterfaceManager(QObject):
             )
             
             # Set up message listener
-            self.notifier = can.Notifier(self.bus, [self._message_listener])
+            self.notifier = can.Notifier(self.bus, [self._message_listener, *self._rx_listeners])
             
             self.interface_type = interface
             self.channel = channel
@@ -138,6 +139,28 @@ class CANInterfaceManager(QObject):
             self.error_occurred.emit(error_msg)
             return False
     
+    def add_rx_listener(self, callback: Callable[[can.Message], None]):
+        """
+        Register a callback called directly for every received message.
+        
+        The callback runs in the notifier thread, without going through a Qt
+        signal, so it must be thread-safe and return quickly.
+        
+        Args:
+            callback: Function taking the received can.Message
+        """
+        self._rx_listeners.append(callback)
+        if self.notifier:
+            self.notifier.add_listener(callback)
+    
+    def remove_rx_listener(self, callback: Callable[[can.Message], None]):
+        """Unregister a callback added with add_rx_listener."""
+        if callback not in self._rx_listeners:
+            return
+        self._rx_listeners.remove(callback)
+        if self.notifier:
+            self.notifier.remove_listener(callback)
+    
     def _message_listener(self, msg: can.Message):
         """Internal callback for received messages."""
         self.message_received.emit(msg)
@@ -6,15 +6,21 @@ Performs statistical analysis and signal processing operations.
 
 import numpy as np
 from scipy import signal as scipy_signal
-from collections import deque
 from typing import Dict, List, Optional, Tuple
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
 
 class SignalProcessor:
-    """Processes CAN signal data for analysis and visualization."""
+    """Processes CAN signal data for analysis and visualization.
+    
+    Each signal is kept in a pair of preallocated numpy ring buffers
+    (timestamps and values). Samples may be added from a worker thread
+    while the GUI reads them; all access to the buffers goes through an
+    internal lock, and readers always get copies.
+    """
     
     def __init__(self, max_samples: int = 10000):
         """
@@ -24,8 +30,11 @@ class SignalProcessor:
             max_samples: Maximum number of samples to keep in memory per signal
         """
         self.max_samples = max_samples
-        self.signal_data: Dict[str, deque] = {}
-        self.timestamps: Dict[str, deque] = {}
+        self.signal_data: Dict[str, np.ndarray] = {}  # Value ring buffer per signal
+        self.timestamps: Dict[str, np.ndarray] = {}  # Timestamp ring buffer per signal
+        self.sample_counts: Dict[str, int] = {}  # Samples added since start, never decreases
+        self._sizes: Dict[str, int] = {}  # Valid samples currently held per signal
+        self._lock = threading.RLock()
         
     def add_sample(self, signal_name: str, value: float, timestamp: float):
         """
@@ -36,12 +45,33 @@ class SignalProcessor:
             value: Signal value
             timestamp: Timestamp in seconds
         """
-        if signal_name not in self.signal_data:
-            self.signal_data[signal_name] = deque(maxlen=self.max_samples)
-            self.timestamps[signal_name] = deque(maxlen=self.max_samples)
-        
-        self.signal_data[signal_name].append(value)
-        self.timestamps[signal_name].append(timestamp)
+        with self._lock:
+            values = self.signal_data.get(signal_name)
+            if values is None:
+                values = self.signal_data[signal_name] = np.empty(self.max_samples)
+                self.timestamps[signal_name] = np.empty(self.max_samples)
+                self._sizes[signal_name] = 0
+            
+            # The write position follows the running count, so clearing only resets the size
+            count = self.sample_counts.get(signal_name, 0)
+            pos = count % self.max_samples
+            values[pos] = value
+            self.timestamps[signal_name][pos] = timestamp
+            self.sample_counts[signal_name] = count + 1
+            if self._sizes[signal_name] < self.max_samples:
+                self._sizes[signal_name] += 1
+    
+    def _tail(self, signal_name: str, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Copy the newest n samples of a signal in time order (lock must be held)."""
+        times = self.timestamps[signal_name]
+        values = self.signal_data[signal_name]
+        end = self.sample_counts[signal_name] % self.max_samples
+        start = end - n
+        if start >= 0:
+            return times[start:end].copy(), values[start:end].copy()
+        # Wrapped: the oldest part sits at the end of the buffer
+        return (np.concatenate((times[start:], times[:end])),
+                np.concatenate((values[start:], values[:end])))
     
     def get_data(self, signal_name: str) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -53,13 +83,37 @@ class SignalProcessor:
         Returns:
             Tuple of (timestamps, values) as numpy arrays
         """
-        if signal_name not in self.signal_data:
-            return np.array([]), np.array([])
+        with self._lock:
+            if signal_name not in self.signal_data:
+                return np.array([]), np.array([])
+            
+            return self._tail(signal_name, self._sizes[signal_name])
+    
+    def get_data_since(self, signal_name: str, since_index: int) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Get only the samples added after a previous call.
         
-        times = np.array(self.timestamps[signal_name])
-        values = np.array(self.signal_data[signal_name])
+        Args:
+            signal_name: Name of the signal
+            since_index: End index returned by the previous call (0 for all data)
+            
+        Returns:
+            Tuple of (timestamps, values, end_index); pass end_index back on the next call
+        """
+        with self._lock:
+            end_index = self.sample_counts.get(signal_name, 0)
+            if signal_name not in self.signal_data:
+                return np.array([]), np.array([]), end_index
+            
+            available = self._sizes[signal_name]
+            new_count = end_index - since_index
+            if new_count < 0 or new_count > available:
+                # Data was cleared or has wrapped past the caller's position
+                new_count = available
+            
+            times, values = self._tail(signal_name, new_count)
         
-        return times, values
+        return times, values, end_index
     
     def get_statistics(self, signal_name: str, window_size: Optional[int] = None) -> Dict[str, float]:
         """
@@ -72,20 +126,21 @@ class SignalProcessor:
         Returns:
             Dictionary with statistics (mean, min, max, std, rms)
         """
-        if signal_name not in self.signal_data or len(self.signal_data[signal_name]) == 0:
-            return {
-                'mean': 0.0,
-                'min': 0.0,
-                'max': 0.0,
-                'std': 0.0,
-                'rms': 0.0,
-                'samples': 0
-            }
-        
-        data = np.array(self.signal_data[signal_name])
-        
-        if window_size and window_size < len(data):
-            data = data[-window_size:]
+        with self._lock:
+            size = self._sizes.get(signal_name, 0)
+            if size == 0:
+                return {
+                    'mean': 0.0,
+                    'min': 0.0,
+                    'max': 0.0,
+                    'std': 0.0,
+                    'rms': 0.0,
+                    'samples': 0
+                }
+            
+            if window_size and window_size < size:
+                size = window_size
+            _, data = self._tail(signal_name, size)
         
         stats = {
             'mean': float(np.mean(data)),
@@ -109,11 +164,12 @@ class SignalProcessor:
         Returns:
             Tuple of (frequencies, magnitudes)
         """
-        if signal_name not in self.signal_data or len(self.signal_data[signal_name]) < 2:
-            return np.array([]), np.array([])
-        
-        times = np.array(self.timestamps[signal_name])
-        values = np.array(self.signal_data[signal_name])
+        with self._lock:
+            size = self._sizes.get(signal_name, 0)
+            if size < 2:
+                return np.array([]), np.array([])
+            
+            times, values = self._tail(signal_name, size)
         
         # Estimate sampling rate if not provided
         if sampling_rate is None and len(times) > 1:
@@ -196,21 +252,23 @@ class SignalProcessor:
     
     def clear_signal(self, signal_name: str):
         """Clear all data for a specific signal."""
-        if signal_name in self.signal_data:
-            self.signal_data[signal_name].clear()
-            self.timestamps[signal_name].clear()
+        with self._lock:
+            if signal_name in self.signal_data:
+                self._sizes[signal_name] = 0
     
     def clear_all(self):
         """Clear all signal data."""
-        self.signal_data.clear()
-        self.timestamps.clear()
+        with self._lock:
+            self.signal_data.clear()
+            self.timestamps.clear()
+            self._sizes.clear()
     
     def get_signal_names(self) -> List[str]:
         """Get list of all signal names."""
-        return list(self.signal_data.keys())
+        with self._lock:
+            return list(self.signal_data.keys())
     
     def get_sample_count(self, signal_name: str) -> int:
         """Get number of samples for a signal."""
-        if signal_name not in self.signal_data:
-            return 0
-        return len(self.signal_data[signal_name])
+        with self._lock:
+            return self._sizes.get(signal_name, 0)
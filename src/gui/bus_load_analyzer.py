@@ -7,16 +7,25 @@ Expert mode panel for analyzing CAN bus load and statistics.
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
                              QLabel, QProgressBar, QTableWidget, QTableWidgetItem,
                              QPushButton, QComboBox, QHeaderView)
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor
 import time
 import logging
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
 
 class BusLoadAnalyzer(QWidget):
-    """Expert mode panel for bus load analysis."""
+    """Expert mode panel for bus load analysis.
+    
+    record_message is called from the CAN notifier thread; it only appends
+    and counts, while pruning and display happen in tick(), driven by the
+    main window's update timer.
+    """
+    
+    RATE_WINDOW = 2.0  # Seconds of timestamps kept for the instant rate
+    UPDATE_INTERVAL = 1.0  # Seconds between display refreshes
     
     def __init__(self, can_manager, parent=None):
         super().__init__(parent)
@@ -28,12 +37,8 @@ class BusLoadAnalyzer(QWidget):
         self.error_count = 0
         self.last_reset_time = time.time()
         self.message_ids = {}  # id -> count
-        self.recent_messages = []  # Recent message timestamps
-        
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_statistics)
-        self.update_timer.start(1000)  # Update every second
+        self.recent_messages = deque()  # Recent message timestamps
+        self._last_update = 0.0  # Monotonic time of the last refresh
         
         self.init_ui()
         
@@ -169,13 +174,19 @@ class BusLoadAnalyzer(QWidget):
         msg_id = msg.arbitration_id
         self.message_ids[msg_id] = self.message_ids.get(msg_id, 0) + 1
         
-        # Track recent messages for rate calculation
-        current_time = time.time()
-        self.recent_messages.append(current_time)
+        # Track recent messages for rate calculation (pruned in update_statistics)
+        self.recent_messages.append(time.time())
+    
+    def tick(self, now: float):
+        """Refresh the displays if UPDATE_INTERVAL elapsed since the last refresh.
         
-        # Keep only messages from last 2 seconds
-        cutoff_time = current_time - 2.0
-        self.recent_messages = [t for t in self.recent_messages if t > cutoff_time]
+        Args:
+            now: Current time.monotonic() value
+        """
+        if now - self._last_update < self.UPDATE_INTERVAL:
+            return
+        self._last_update = now
+        self.update_statistics()
     
     def update_statistics(self):
         """Update all statistics displays."""
@@ -185,9 +196,15 @@ class BusLoadAnalyzer(QWidget):
         if elapsed_time == 0:
             return
         
+        # Keep only messages from the last 2 seconds
+        recent = self.recent_messages
+        cutoff_time = current_time - self.RATE_WINDOW
+        while recent and recent[0] <= cutoff_time:
+            recent.popleft()
+        
         # Calculate rates
         avg_msg_rate = self.message_count / elapsed_time if elapsed_time > 0 else 0
-        instant_msg_rate = len(self.recent_messages) / 2.0  # Messages in last 2 seconds / 2
+        instant_msg_rate = len(recent) / self.RATE_WINDOW
         
         # Calculate bandwidth (assume 8 data bytes + 6 overhead bytes per message, 1 start bit + 8 data bits + 1 stop bit per byte)
         # Simplified: ~14 bytes per message * 10 bits/byte = 140 bits per message
@@ -233,7 +250,8 @@ class BusLoadAnalyzer(QWidget):
     def update_top_messages_table(self):
         """Update the top messages table."""
         # Sort by count
-        sorted_messages = sorted(self.message_ids.items(), key=lambda x: x[1], reverse=True)
+        # Copy first: record_message may add ids from the notifier thread
+        sorted_messages = sorted(self.message_ids.copy().items(), key=lambda x: x[1], reverse=True)
         
         # Show top 10
         top_messages = sorted_messages[:10]
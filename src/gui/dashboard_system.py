@@ -9,8 +9,10 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
                              QPushButton, QLabel, QFrame, QMenu, QAction,
                              QFileDialog, QMessageBox, QDialog, QComboBox,
                              QLineEdit, QSpinBox, QCheckBox, QColorDialog,
-                             QFormLayout, QDialogButtonBox, QScrollArea)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QPointF
+                             QFormLayout, QDialogButtonBox, QScrollArea,
+                             QCompleter)
+from PyQt5.QtCore import (Qt, pyqtSignal, QTimer, QPointF, QSignalBlocker,
+                          QSortFilterProxyModel)
 from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QFont, QLinearGradient
 import pyqtgraph as pg
 
@@ -648,20 +650,7 @@ class DashboardWidget(QWidget):
         
         # Signal selection
         signal_combo = QComboBox()
-        signal_combo.addItem("Sélectionner un signal...", None)
-        # Populate from available signals
-        for interface_id, signals in self.available_signals.items():
-            for msg_name, signal_name, unit in signals:
-                display_text = f"[{interface_id}] {msg_name} → {signal_name}"
-                if unit:
-                    display_text += f" ({unit})"
-                signal_data = {
-                    'interface_id': interface_id,
-                    'message': msg_name,
-                    'signal': signal_name,
-                    'unit': unit
-                }
-                signal_combo.addItem(display_text, signal_data)
+        self.populate_signal_combo(signal_combo)
         form.addRow("Signal:", signal_combo)
         
         # Position
@@ -754,6 +743,7 @@ class DashboardWidget(QWidget):
             widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
             self.grid_layout.addWidget(widget, row, col, rowspan, colspan)
             self.widgets[(row, col)] = widget
+            widget.setProperty('dash_pos', (row, col))
             
             # Save configuration
             self.widget_configs[(row, col)] = {
@@ -848,15 +838,88 @@ class DashboardWidget(QWidget):
         """
         self.available_signals[interface_id] = signals
     
+    def populate_signal_combo(self, signal_combo, current_signal_data=None):
+        """Fill a signal combo with all available signals
+        
+        Rows are inserted in one batch on the combo model and filled in
+        place, so the view receives a single rowsInserted notification.
+        
+        Args:
+            signal_combo: QComboBox to populate
+            current_signal_data: Optional signal_data dict to locate
+            
+        Returns:
+            Index of the row matching current_signal_data (0 if none)
+        """
+        signal_combo.addItem("Sélectionner un signal...", None)
+        
+        model = signal_combo.model()
+        total = sum(len(signals) for signals in self.available_signals.values())
+        if not total:
+            return 0
+        model.insertRows(1, total)
+        
+        current_key = None
+        if current_signal_data:
+            current_key = (current_signal_data.get('interface_id'),
+                           current_signal_data.get('message'),
+                           current_signal_data.get('signal'))
+        current_index = 0
+        
+        row = 1
+        seen = set()
+        for interface_id, signals in self.available_signals.items():
+            for msg_name, signal_name, unit in signals:
+                key = (interface_id, msg_name, signal_name)
+                if key in seen:
+                    continue
+                seen.add(key)
+                
+                display_text = f"[{interface_id}] {msg_name} → {signal_name}"
+                if unit:
+                    display_text += f" ({unit})"
+                signal_data = {
+                    'interface_id': interface_id,
+                    'message': msg_name,
+                    'signal': signal_name,
+                    'unit': unit
+                }
+                index = model.index(row, 0)
+                model.setData(index, display_text, Qt.DisplayRole)
+                model.setData(index, signal_data, Qt.UserRole)
+                
+                # Check if this is the current signal
+                if current_key == key:
+                    current_index = row
+                row += 1
+        
+        # Drop rows reserved for duplicates
+        if row < total + 1:
+            model.removeRows(row, total + 1 - row)
+        
+        self._install_signal_completer(signal_combo)
+        return current_index
+    
+    def _install_signal_completer(self, signal_combo):
+        """Make the signal combo searchable through a sorted completer"""
+        proxy = QSortFilterProxyModel(signal_combo)
+        proxy.setSourceModel(signal_combo.model())
+        proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        proxy.setSortCaseSensitivity(Qt.CaseInsensitive)
+        proxy.sort(0)
+        
+        completer = QCompleter(proxy, signal_combo)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchContains)
+        completer.setMaxVisibleItems(10)
+        
+        signal_combo.setEditable(True)
+        signal_combo.setInsertPolicy(QComboBox.NoInsert)
+        signal_combo.setCompleter(completer)
+    
     def edit_widget(self, widget):
         """Edit an existing widget"""
-        # Find widget position
-        widget_pos = None
-        for pos, w in self.widgets.items():
-            if w == widget:
-                widget_pos = pos
-                break
-        
+        widget_pos = widget.property('dash_pos')
         if not widget_pos:
             return
         
@@ -877,32 +940,8 @@ class DashboardWidget(QWidget):
         
         # Signal selection
         signal_combo = QComboBox()
-        signal_combo.addItem("Sélectionner un signal...", None)
-        
         current_signal_data = config.get('config', {}).get('signal_data')
-        current_index = 0
-        
-        # Populate signals
-        for interface_id, signals in self.available_signals.items():
-            for idx, (msg_name, signal_name, unit) in enumerate(signals):
-                display_text = f"[{interface_id}] {msg_name} → {signal_name}"
-                if unit:
-                    display_text += f" ({unit})"
-                signal_data = {
-                    'interface_id': interface_id,
-                    'message': msg_name,
-                    'signal': signal_name,
-                    'unit': unit
-                }
-                signal_combo.addItem(display_text, signal_data)
-                
-                # Check if this is the current signal
-                if current_signal_data and \
-                   signal_data['interface_id'] == current_signal_data.get('interface_id') and \
-                   signal_data['message'] == current_signal_data.get('message') and \
-                   signal_data['signal'] == current_signal_data.get('signal'):
-                    current_index = signal_combo.count() - 1
-        
+        current_index = self.populate_signal_combo(signal_combo, current_signal_data)
         signal_combo.setCurrentIndex(current_index)
         form.addRow("Signal:", signal_combo)
         
@@ -929,21 +968,13 @@ class DashboardWidget(QWidget):
             
             # Update config
             config['title'] = new_title
-            if 'config' not in config:
-                config['config'] = {}
-            config['config']['signal_data'] = signal_data
+            config.setdefault('config', {})['signal_data'] = signal_data
             
             widget.update()
     
     def remove_widget(self, widget):
         """Remove a widget from the dashboard"""
-        # Find widget position
-        widget_pos = None
-        for pos, w in self.widgets.items():
-            if w == widget:
-                widget_pos = pos
-                break
-        
+        widget_pos = widget.property('dash_pos')
         if not widget_pos:
             return
         
@@ -968,13 +999,7 @@ class DashboardWidget(QWidget):
     
     def resize_widget(self, widget):
         """Resize a widget (change rowspan/colspan)"""
-        # Find widget position
-        widget_pos = None
-        for pos, w in self.widgets.items():
-            if w == widget:
-                widget_pos = pos
-                break
-        
+        widget_pos = widget.property('dash_pos')
         if not widget_pos:
             return
         
@@ -982,6 +1007,12 @@ class DashboardWidget(QWidget):
         current_rowspan = config.get('rowspan', 1)
         current_colspan = config.get('colspan', 1)
         
+        # Bound spans by the cells left in the grid from the widget anchor,
+        # never below the current span so OK cannot shrink the widget
+        row, col = widget_pos
+        max_rowspan = max(current_rowspan, self.grid_layout.rowCount() - row)
+        max_colspan = max(current_colspan, self.grid_layout.columnCount() - col)
+        
         # Create resize dialog
         dialog = QDialog(self)
         dialog.setWindowTitle("Redimensionner Widget")
@@ -993,14 +1024,14 @@ class DashboardWidget(QWidget):
         # Rowspan
         rowspan_spin = QSpinBox()
         rowspan_spin.setMinimum(1)
-        rowspan_spin.setMaximum(5)
+        rowspan_spin.setMaximum(max_rowspan)
         rowspan_spin.setValue(current_rowspan)
         form.addRow("Hauteur (lignes):", rowspan_spin)
         
         # Colspan
         colspan_spin = QSpinBox()
         colspan_spin.setMinimum(1)
-        colspan_spin.setMaximum(5)
+        colspan_spin.setMaximum(max_colspan)
         colspan_spin.setValue(current_colspan)
         form.addRow("Largeur (colonnes):", colspan_spin)
         
@@ -1021,7 +1052,6 @@ class DashboardWidget(QWidget):
             self.grid_layout.removeWidget(widget)
             
             # Re-add with new size
-            row, col = widget_pos
             self.grid_layout.addWidget(widget, row, col, new_rowspan, new_colspan)
             
             # Update config
@@ -1100,19 +1130,26 @@ class DashboardManager(QWidget):
         
         self.dashboards[name] = dashboard
         
-        self.dashboard_combo.addItem(name)
-        self.dashboard_combo.setCurrentText(name)
+        # Mute currentTextChanged so the switch happens exactly once
+        with QSignalBlocker(self.dashboard_combo):
+            self.dashboard_combo.addItem(name)
+            self.dashboard_combo.setCurrentText(name)
+        self.switch_dashboard(name)
         
     def switch_dashboard(self, name):
         """Switch to a different dashboard"""
+        target = self.dashboards.get(name)
+        if target is self.current_dashboard:
+            return
+        
         # Hide current
         if self.current_dashboard:
             self.current_dashboard.hide()
             self.stack_layout.removeWidget(self.current_dashboard)
             
         # Show new
-        if name in self.dashboards:
-            self.current_dashboard = self.dashboards[name]
+        if target is not None:
+            self.current_dashboard = target
             self.stack_layout.addWidget(self.current_dashboard)
             self.current_dashboard.show()
             
@@ -1140,8 +1177,10 @@ class DashboardManager(QWidget):
                 
                 if dashboard.import_dashboard(file_path):
                     self.dashboards[name] = dashboard
-                    self.dashboard_combo.addItem(name)
-                    self.dashboard_combo.setCurrentText(name)
+                    with QSignalBlocker(self.dashboard_combo):
+                        self.dashboard_combo.addItem(name)
+                        self.dashboard_combo.setCurrentText(name)
+                    self.switch_dashboard(name)
                     
             except Exception as e:
                 QMessageBox.critical(
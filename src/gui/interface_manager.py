@@ -3,20 +3,188 @@ Interface Manager - Gestion complète des interfaces CAN
 Panneau latéral pour gérer plusieurs interfaces CAN avec leurs DBC/SYM
 """
 
+import ctypes
+import functools
+import logging
+import os
+import platform
+import threading
+import time
+from collections import defaultdict
+
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                              QLabel, QComboBox, QLineEdit, QTreeWidget, QTreeWidgetItem,
                              QFrame, QProgressBar, QCheckBox, QMenu, QAction, QMessageBox,
-                             QFileDialog)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
-from PyQt5.QtGui import QIcon, QColor
+                             QFileDialog, QScrollArea, QDialog, QDialogButtonBox,
+                             QFormLayout, QApplication)
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QThread, QSignalBlocker, QEvent
+from PyQt5.QtGui import QIcon, QColor, QStandardItem, QStandardItemModel
+
+try:
+    import can
+except ImportError:  # python-can absent : seule la détection SocketCAN reste possible
+    can = None
+
+try:
+    import pyudev
+    from pyudev.pyqt5 import MonitorObserver as UdevMonitorObserver
+except ImportError:  # pyudev optionnel : pas de détection à chaud
+    pyudev = None
+
+logger = logging.getLogger(__name__)
+
+_SYSTEM = platform.system()
+_IS_LINUX = _SYSTEM == "Linux"
+
+# Bibliothèques des pilotes constructeurs, par système
+_DRIVER_LIBRARIES = {
+    'pcan': {"Windows": "PCANBasic.dll", "Linux": "libpcanbasic.so",
+             "Darwin": "libPCBUSB.dylib"},
+    'ixxat': {"Windows": "vcinpl.dll", "Linux": "libvci.so"},
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _has_driver(interface):
+    """Check whether the vendor driver for a python-can interface is installed"""
+    library = _DRIVER_LIBRARIES[interface].get(_SYSTEM)
+    if library is None:
+        return False
+    try:
+        if _SYSTEM == "Windows":
+            ctypes.WinDLL(library)
+        else:
+            ctypes.CDLL(library)
+        return True
+    except OSError:
+        return False
+
+
+def _has_pcan_driver():
+    return _has_driver('pcan')
+
+
+def _has_ixxat_driver():
+    return _has_driver('ixxat')
+
+
+# Identifiants USB des fabricants PEAK (PCAN) et IXXAT
+_CAN_USB_VENDOR_IDS = {"0c72", "08d8"}
+
+# Durée (s) pendant laquelle le résultat de détection matérielle est réutilisé
+DEVICE_CACHE_TTL = 5.0
+
+# Styles de la barre de charge, précalculés par niveau
+_LOAD_QSS = {
+    color: f"""
+        QProgressBar::chunk {{
+            background-color: {hex_color};
+            border-radius: 3px;
+        }}
+    """
+    for color, hex_color in (
+        ('green', "#238636"),
+        ('orange', "#d29922"),
+        ('red', "#da3633"),
+    )
+}
+
+
+def _socketcan_state(channel):
+    """Read a SocketCAN interface operational state from sysfs (e.g. "up", "down")"""
+    try:
+        with open(f"/sys/class/net/{channel}/operstate") as f:
+            return f.read().strip()
+    except OSError:
+        return "unknown"
+
+
+_db_file_dialog = None
+
+
+def _get_db_file_dialog():
+    """Return the database file dialog shared by all interface widgets"""
+    global _db_file_dialog
+    if _db_file_dialog is None:
+        # Sans parent : le dialogue survit à la suppression d'une interface
+        _db_file_dialog = QFileDialog(None, "Sélectionner une base de données")
+        _db_file_dialog.setNameFilter("Database Files (*.dbc *.sym);;All Files (*)")
+        _db_file_dialog.setFileMode(QFileDialog.ExistingFile)
+    return _db_file_dialog
+
+
+def _device_item(text, data, selectable=True):
+    """Build a device combo row; informative rows cannot be selected"""
+    item = QStandardItem(text)
+    item.setData(data, Qt.UserRole)
+    if not selectable:
+        item.setFlags(item.flags() & ~(Qt.ItemIsSelectable | Qt.ItemIsEnabled))
+    return item
+
+
+def _separator_item():
+    """Build a combo separator row, painted as a line by the combo delegate"""
+    item = QStandardItem()
+    item.setFlags(Qt.NoItemFlags)
+    item.setData("separator", Qt.AccessibleDescriptionRole)
+    return item
+
+
+class HardwareDetectionThread(QThread):
+    """Thread de détection du matériel CAN hors du thread GUI
+    
+    devices_detected est toujours émis, avec une liste vide si la détection
+    échoue. L'application attend la fin du thread avant de quitter.
+    """
+    
+    devices_detected = pyqtSignal(list)  # [(type, channel, state), ...]
+    
+    def __init__(self, probe, parent=None):
+        super().__init__(parent)
+        self._probe = probe
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.wait)
+        
+    def run(self):
+        # An exception escaping run() would abort the application
+        try:
+            devices = self._probe()
+        except Exception:
+            logger.exception("Hardware detection failed")
+            devices = []
+        self.devices_detected.emit(devices)
+
 
 class CanInterfaceWidget(QWidget):
     """Widget pour une interface CAN individuelle"""
     
-    connect_requested = pyqtSignal(str)  # interface_id
-    disconnect_requested = pyqtSignal(str)
+    action = pyqtSignal(str, str)  # verb ("connect"/"disconnect"), argument
     database_changed = pyqtSignal(str, str)  # interface_id, db_path
     
+    # Feuille de style unique ; l'état connecté passe par des propriétés dynamiques
+    STYLE = """
+        CanInterfaceWidget {
+            background-color: #161b22;
+            border: 1px solid #30363d;
+            border-radius: 8px;
+        }
+        CanInterfaceWidget[connected="true"] {
+            border: 2px solid #238636;
+        }
+        QPushButton[state="connected"] {
+            background-color: #238636;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 6px 12px;
+            font-weight: 500;
+        }
+        QPushButton[state="connected"]:hover {
+            background-color: #2ea043;
+        }
+    """
+    
     def __init__(self, interface_id, interface_type, parent=None):
         super().__init__(parent)
         self.interface_id = interface_id
@@ -26,9 +194,27 @@ class CanInterfaceWidget(QWidget):
         self.message_count = 0
         self.error_count = 0
         self.database_path = None
+        self._needs_db = interface_type.lower() != "virtual"
+        self._db_index = {}  # db_path -> index in db_combo
+        
+        # Dernières valeurs reçues, appliquées au prochain rafraîchissement
+        self._pending_load = None
+        self._pending_stats = None
+        # Valeurs actuellement affichées
+        self._shown_load = None
+        self._shown_load_color = None
+        self._shown_stats = None
+        # Rafraîchissement reporté tant que le widget est hors de la zone visible
+        self._refresh_deferred = False
         
         self.init_ui()
         
+        # Regroupe les mises à jour rapides en un rafraîchissement toutes les 100 ms
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(100)
+        self._refresh_timer.timeout.connect(self._flush_updates)
+        
     def init_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
@@ -107,40 +293,35 @@ class CanInterfaceWidget(QWidget):
         
         layout.addLayout(stats_layout)
         
+        # Avertissement non bloquant (connexion sans base de données)
+        self._warn_label = QLabel(
+            "⚠️ Aucune base DBC/SYM : messages bruts uniquement, "
+            "chargez-en une pour décoder les signaux."
+        )
+        self._warn_label.setWordWrap(True)
+        self._warn_label.setStyleSheet("font-size: 11px; color: #d29922;")
+        self._warn_label.hide()
+        layout.addWidget(self._warn_label)
+        
         # Style du widget
         self.setFrameStyle()
         
     def setFrameStyle(self):
         """Style du cadre de l'interface"""
-        self.setStyleSheet("""
-            CanInterfaceWidget {
-                background-color: #161b22;
-                border: 1px solid #30363d;
-                border-radius: 8px;
-            }
-        """)
+        self.setProperty("connected", False)
+        self.connect_btn.setProperty("state", "")
+        self.setStyleSheet(self.STYLE)
         
     def toggle_connection(self):
         """Toggle connection state"""
         if self.connect_btn.isChecked():
             # Warn if no database is loaded (but allow connection)
-            if self.interface_type != "virtual" and self.db_combo.currentData() is None:
-                reply = QMessageBox.question(
-                    self,
-                    "Connexion sans base de données",
-                    "Aucune base de données DBC/SYM n'est chargée.\n\n"
-                    "Vous pourrez voir les messages CAN bruts mais pas les signaux décodés.\n"
-                    "Vous pouvez charger une base de données après la connexion.\n\n"
-                    "Continuer sans base de données ?",
-                    QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.Yes
-                )
-                if reply == QMessageBox.No:
-                    self.connect_btn.setChecked(False)
-                    return
-            self.connect_requested.emit(self.interface_id)
+            if self._needs_db and self.db_combo.currentData() is None:
+                self._warn_label.show()
+                QTimer.singleShot(5000, self._warn_label.hide)
+            self.action.emit("connect", self.interface_id)
         else:
-            self.disconnect_requested.emit(self.interface_id)
+            self.action.emit("disconnect", self.interface_id)
             
     def set_connected(self, connected):
         """Update connection state"""
@@ -149,61 +330,89 @@ class CanInterfaceWidget(QWidget):
         
         if connected:
             self.connect_btn.setText("Déconnecter")
-            self.connect_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #238636;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 6px 12px;
-                    font-weight: 500;
-                }
-                QPushButton:hover {
-                    background-color: #2ea043;
-                }
-            """)
-            self.setStyleSheet("""
-                CanInterfaceWidget {
-                    background-color: #161b22;
-                    border: 2px solid #238636;
-                    border-radius: 8px;
-                }
-            """)
         else:
             self.connect_btn.setText("Connecter")
-            self.connect_btn.setStyleSheet("")
-            self.setFrameStyle()
             self.update_bus_load(0.0)
+        
+        # Re-polish only on an actual state change
+        if self.property("connected") == connected:
+            return
+        
+        # Bascule des propriétés dynamiques puis re-polish, sans re-parser de QSS
+        self.setProperty("connected", connected)
+        self.connect_btn.setProperty("state", "connected" if connected else "")
+        for widget in (self, self.connect_btn):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
             
     def update_bus_load(self, load_percent):
-        """Update bus load display"""
+        """Update bus load display (coalesced)"""
         self.bus_load = load_percent
-        self.load_bar.setValue(int(load_percent))
-        
-        # Couleur selon la charge
-        if load_percent < 50:
-            color = "#238636"  # Vert
-        elif load_percent < 80:
-            color = "#d29922"  # Orange
-        else:
-            color = "#da3633"  # Rouge
-            
-        self.load_bar.setStyleSheet(f"""
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 3px;
-            }}
-        """)
+        self._pending_load = load_percent
+        self._schedule_refresh()
         
     def update_statistics(self, message_count, error_count):
-        """Update statistics display"""
+        """Update statistics display (coalesced)"""
         self.message_count = message_count
         self.error_count = error_count
-        self.msg_label.setText(f"Messages: {message_count}")
-        self.error_label.setText(f"Erreurs: {error_count}")
+        self._pending_stats = (message_count, error_count)
+        self._schedule_refresh()
+        
+    def _schedule_refresh(self):
+        """Start the refresh timer unless a refresh is already pending"""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+            
+    def _flush_updates(self):
+        """Apply the latest pending values, skipping unchanged ones
+        
+        Rows scrolled out of the panel viewport keep their pending values
+        until they are exposed again (see paintEvent).
+        """
+        if self.visibleRegion().isEmpty():
+            self._refresh_deferred = True
+            return
+        
+        if self._pending_load is not None:
+            load = int(self._pending_load)
+            self._pending_load = None
+            if load != self._shown_load:
+                self._shown_load = load
+                self.load_bar.setValue(load)
+                
+                # Couleur selon la charge
+                if load < 50:
+                    color = 'green'
+                elif load < 80:
+                    color = 'orange'
+                else:
+                    color = 'red'
+                    
+                if color != self._shown_load_color:
+                    self._shown_load_color = color
+                    self.load_bar.setStyleSheet(_LOAD_QSS[color])
+        
+        if self._pending_stats is not None:
+            stats = self._pending_stats
+            self._pending_stats = None
+            if stats != self._shown_stats:
+                self._shown_stats = stats
+                message_count, error_count = stats
+                self.msg_label.setText(f"Messages: {message_count}")
+                self.error_label.setText(f"Erreurs: {error_count}")
+        
+    def paintEvent(self, event):
+        """Apply deferred updates once the widget is exposed again"""
+        super().paintEvent(event)
+        if self._refresh_deferred:
+            self._refresh_deferred = False
+            QTimer.singleShot(0, self._flush_updates)
         
     def add_database(self, name, path):
         """Add a database to the combo box"""
+        if path in self._db_index:
+            return
+        self._db_index[path] = self.db_combo.count()
         self.db_combo.addItem(name, path)
         
     def on_database_changed(self, index):
@@ -224,27 +433,212 @@ class CanInterfaceWidget(QWidget):
             
     def browse_database(self):
         """Browse for database file"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Sélectionner une base de données",
-            "",
-            "Database Files (*.dbc *.sym);;All Files (*)"
-        )
+        dialog = _get_db_file_dialog()
+        file_path = dialog.selectedFiles()[0] if dialog.exec_() else ""
         
         if file_path:
-            import os
             file_name = os.path.basename(file_path)
             # Check if already in combo
-            found = False
-            for i in range(self.db_combo.count()):
-                if self.db_combo.itemData(i) == file_path:
-                    self.db_combo.setCurrentIndex(i)
-                    found = True
-                    break
-                    
-            if not found:
+            index = self._db_index.get(file_path)
+            if index is None:
+                index = self.db_combo.count()
+                self._db_index[file_path] = index
                 self.db_combo.addItem(file_name, file_path)
-                self.db_combo.setCurrentIndex(self.db_combo.count() - 1)
+            self.db_combo.setCurrentIndex(index)
+
+
+class _AddInterfaceDialog(QDialog):
+    """Dialogue d'ajout d'interface, construit une fois et réutilisé"""
+    
+    def __init__(self, panel):
+        super().__init__(panel)
+        self.panel = panel
+        self.selected_interface = {"type": None, "channel": None}
+        
+        self.setWindowTitle("Ajouter une interface CAN")
+        self.setMinimumWidth(500)
+        
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        
+        # Name field
+        self.name_edit = QLineEdit()
+        self.name_edit.setPlaceholderText("Mon Interface CAN")
+        form.addRow("Nom:", self.name_edit)
+        
+        # Device selection combo with refresh button
+        device_layout = QHBoxLayout()
+        self.device_combo = QComboBox()
+        self.device_combo.setMinimumHeight(32)
+        device_layout.addWidget(self.device_combo)
+        
+        refresh_btn = QPushButton("⟳")
+        refresh_btn.setFixedSize(32, 32)
+        refresh_btn.setToolTip("Rafraîchir la liste des périphériques")
+        refresh_btn.setCursor(Qt.PointingHandCursor)
+        device_layout.addWidget(refresh_btn)
+        
+        # Refresh in the background; the combo is refilled when the probe completes
+        refresh_btn.clicked.connect(lambda: panel.refresh_hardware_devices(force=True))
+        panel.hardware_devices_changed.connect(self.on_devices_detected)
+        
+        form.addRow("Périphérique:", device_layout)
+        
+        # Manual type selection combo (hidden by default)
+        self.manual_type_combo = QComboBox()
+        self.manual_type_combo.addItems(["PCAN", "IXXAT"])
+        self.manual_type_combo.setMinimumHeight(32)
+        self.manual_type_combo.hide()
+        
+        # Manual channel input (hidden by default)
+        self.manual_channel_edit = QLineEdit()
+        self.manual_channel_edit.setPlaceholderText("Ex: PCAN_USBBUS1 ou 0")
+        self.manual_channel_edit.hide()
+        
+        # Add manual type row (initially hidden)
+        self.type_row_label = QLabel("Type:")
+        form.addRow(self.type_row_label, self.manual_type_combo)
+        self.type_row_label.hide()
+        
+        # Add manual channel row (initially hidden)
+        self.channel_row_label = QLabel("Canal:")
+        form.addRow(self.channel_row_label, self.manual_channel_edit)
+        self.channel_row_label.hide()
+        
+        # Virtual interface options (initially hidden)
+        self.virtual_type_combo = QComboBox()
+        self.virtual_type_combo.addItems(["Virtual CAN", "SocketCAN (can0)", "SocketCAN (vcan0)"])
+        self.virtual_type_combo.setMinimumHeight(32)
+        self.virtual_type_combo.hide()
+        
+        self.virtual_row_label = QLabel("Interface:")
+        form.addRow(self.virtual_row_label, self.virtual_type_combo)
+        self.virtual_row_label.hide()
+        
+        self.device_combo.currentIndexChanged.connect(self.on_device_changed)
+        self.manual_type_combo.currentTextChanged.connect(self.on_manual_type_changed)
+        self.virtual_type_combo.currentTextChanged.connect(self.on_virtual_type_changed)
+        
+        # Bitrate
+        self.bitrate_combo = QComboBox()
+        self.bitrate_combo.addItems(["125000", "250000", "500000", "1000000"])
+        self.bitrate_combo.setCurrentText("500000")
+        self.bitrate_combo.setMinimumHeight(32)
+        form.addRow("Bitrate:", self.bitrate_combo)
+        
+        layout.addLayout(form)
+        
+        # Buttons
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        
+    def reset(self):
+        """Prepare the dialog for a new interface"""
+        self.name_edit.clear()
+        self.manual_channel_edit.clear()
+        self.manual_type_combo.setCurrentIndex(0)
+        self.virtual_type_combo.setCurrentIndex(0)
+        self.selected_interface = {"type": None, "channel": None}
+        self.populate_devices()
+        
+    def on_devices_detected(self, devices):
+        """Refill the device list when a probe completes while the dialog is open"""
+        if self.isVisible():
+            self.populate_devices(devices)
+        
+    def populate_devices(self, detected_devices=None):
+        """Populate device combo with detected devices"""
+        device_combo = self.device_combo
+        previous = device_combo.currentData()
+        if detected_devices is None:
+            detected_devices = self.panel.detect_hardware_devices()
+        
+        # Build the rows offline, then hand the whole model to the combo at once
+        rows = []
+        if detected_devices is None:
+            rows.append(_device_item("⏳ Détection…", "no_device", selectable=False))
+        elif detected_devices:
+            rows.append(_device_item("🔍 Périphériques détectés:", "header", selectable=False))
+            for dev_type, channel, state in detected_devices:
+                label = f"  {dev_type} - {channel}"
+                if state:
+                    label += f" ({state})"
+                rows.append(_device_item(label, (dev_type, channel)))
+        else:
+            rows.append(_device_item("⚠️ Aucun périphérique détecté", "no_device", selectable=False))
+        rows.append(_separator_item())
+        rows.append(_device_item("⚙️ Configuration manuelle", "manual"))
+        rows.append(_separator_item())
+        rows.append(_device_item("🖥️ SocketCAN / Virtual", "virtual"))
+        
+        model = QStandardItemModel(device_combo)
+        model.appendColumn(rows)
+        
+        # Keep the user's choice if it is still listed, else start on the
+        # first selectable row rather than a header
+        selectable = [row for row, item in enumerate(rows) if item.isEnabled()]
+        first_row = next((row for row in selectable
+                          if rows[row].data(Qt.UserRole) == previous), selectable[0])
+        
+        # Mute currentIndexChanged while swapping; on_device_changed runs once at the end
+        blocker = QSignalBlocker(device_combo)
+        device_combo.setModel(model)
+        device_combo.setCurrentIndex(first_row)
+        
+        blocker.unblock()
+        self.on_device_changed()
+        
+    def on_device_changed(self):
+        """Handle device selection change"""
+        current_data = self.device_combo.currentData()
+        show_manual = current_data == "manual"
+        show_virtual = current_data == "virtual"
+        
+        # Toggle all rows with a single relayout and repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self.manual_type_combo.setVisible(show_manual)
+            self.manual_channel_edit.setVisible(show_manual)
+            self.type_row_label.setVisible(show_manual)
+            self.channel_row_label.setVisible(show_manual)
+            self.virtual_type_combo.setVisible(show_virtual)
+            self.virtual_row_label.setVisible(show_virtual)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        if show_manual:
+            # Manual configuration
+            self.selected_interface["type"] = self.manual_type_combo.currentText()
+            self.selected_interface["channel"] = None
+        elif show_virtual:
+            # Virtual options, following the visible virtual combo
+            self.on_virtual_type_changed()
+        elif isinstance(current_data, tuple):
+            # Detected device selected
+            dev_type, channel = current_data
+            self.selected_interface["type"] = dev_type
+            self.selected_interface["channel"] = channel
+            
+    def on_manual_type_changed(self):
+        """Manual type changed"""
+        self.selected_interface["type"] = self.manual_type_combo.currentText()
+        
+    def on_virtual_type_changed(self):
+        """Virtual type changed"""
+        vtype = self.virtual_type_combo.currentText()
+        if vtype == "Virtual CAN":
+            self.selected_interface["type"] = "Virtual"
+            self.selected_interface["channel"] = "virtual"
+        elif "can0" in vtype:
+            self.selected_interface["type"] = "SocketCAN"
+            self.selected_interface["channel"] = "can0"
+        elif "vcan0" in vtype:
+            self.selected_interface["type"] = "SocketCAN"
+            self.selected_interface["channel"] = "vcan0"
 
 
 class InterfaceManagerPanel(QWidget):
@@ -254,11 +648,25 @@ class InterfaceManagerPanel(QWidget):
     interface_removed = pyqtSignal(str)
     connection_requested = pyqtSignal(str, str, str)  # interface_id, interface_type, db_path
     disconnection_requested = pyqtSignal(str)
+    hardware_devices_changed = pyqtSignal(list)  # [(type, channel, state), ...]
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.interfaces = {}  # interface_id -> CanInterfaceWidget
+        self._cached_devices = None  # None until the first probe completes
+        self._cached_devices_time = 0.0
+        self._detection_thread = None
+        self._add_dialog = None  # _AddInterfaceDialog, built on first use
+        # Latest updates per interface, written from any thread and drained on a timer
+        self._pending = defaultdict(dict)  # interface_id -> {'connected'|'load'|'stats': value}
+        self._pending_lock = threading.Lock()
+        self._child_action_handlers = {
+            "connect": self.on_connect_requested,
+            "disconnect": self.on_disconnect_requested,
+        }
         self.init_ui()
+        self.refresh_hardware_devices()
+        self._hotplug_observer = self._start_hotplug_monitor()
         
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -308,8 +716,6 @@ class InterfaceManagerPanel(QWidget):
         layout.addWidget(header)
         
         # Scroll area pour les interfaces
-        from PyQt5.QtWidgets import QScrollArea
-        
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
@@ -324,233 +730,183 @@ class InterfaceManagerPanel(QWidget):
         scroll.setWidget(self.interfaces_container)
         layout.addWidget(scroll)
         
+        # Applique les mises à jour en attente en un seul passage GUI
+        self._drain_timer = QTimer(self)
+        self._drain_timer.timeout.connect(self._drain_updates)
+        self._drain_timer.start(50)
+        
+    def refresh_hardware_devices(self, force=False):
+        """Start a background hardware probe if the cache is stale
+        
+        Args:
+            force: Probe even if the cached result is still fresh
+        """
+        if self._detection_thread is not None:
+            return  # Probe already running
+        if (not force and self._cached_devices is not None and
+                time.monotonic() - self._cached_devices_time < DEVICE_CACHE_TTL):
+            return
+        
+        thread = HardwareDetectionThread(self._probe_hardware_devices_blocking, self)
+        thread.devices_detected.connect(self._on_devices_detected)
+        thread.finished.connect(self._on_detection_finished)
+        thread.finished.connect(thread.deleteLater)
+        self._detection_thread = thread
+        thread.start()
+        
+    def _on_detection_finished(self):
+        """Allow the next probe once the detection thread has exited"""
+        self._detection_thread = None
+        
+    def stop_hardware_detection(self):
+        """Wait for a running probe, the thread must not outlive the panel"""
+        if self._detection_thread is not None:
+            self._detection_thread.wait()
+        
+    def event(self, event):
+        if event.type() == QEvent.DeferredDelete:
+            self.stop_hardware_detection()
+        return super().event(event)
+        
+    def _on_devices_detected(self, devices):
+        """Store the probe result and notify listeners"""
+        self._cached_devices = devices
+        self._cached_devices_time = time.monotonic()
+        self.hardware_devices_changed.emit(devices)
+        
+    def _start_hotplug_monitor(self):
+        """Watch udev for CAN adapters being plugged or unplugged (Linux, pyudev)
+        
+        Returns:
+            The udev observer, or None when hotplug monitoring is unavailable
+        """
+        if pyudev is None or not _IS_LINUX:
+            return None
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by('net')
+            monitor.filter_by('usb', 'usb_device')
+            observer = UdevMonitorObserver(monitor, self)
+            observer.deviceEvent.connect(self._on_hotplug_event)
+            monitor.start()
+        except OSError:
+            return None
+        return observer
+        
+    def _on_hotplug_event(self, device):
+        """Re-probe hardware when a CAN interface or adapter appears or disappears"""
+        if device.subsystem == 'net':
+            relevant = device.sys_name.startswith(("can", "vcan"))
+        else:
+            relevant = device.get('ID_VENDOR_ID') in _CAN_USB_VENDOR_IDS
+        if relevant:
+            self.refresh_hardware_devices(force=True)
+        
     def detect_hardware_devices(self):
-        """Detect all connected CAN hardware devices"""
+        """Get the connected CAN hardware devices from the cache
+        
+        Triggers a background refresh when the cache is older than
+        DEVICE_CACHE_TTL.
+        
+        Returns:
+            List of (type, channel, state) tuples, state being None when
+            unknown, or None while the first
+            probe is still running
+        """
+        self.refresh_hardware_devices()
+        return self._cached_devices
+        
+    def _probe_hardware_devices_blocking(self):
+        """Detect all connected CAN hardware devices (blocking, runs in a worker thread)"""
+        devices = []
+        
+        # Detect PCAN/IXXAT devices through the drivers' enumeration APIs,
+        # skipping vendors whose driver is not installed
+        if can is not None:
+            interfaces = []
+            if _has_pcan_driver():
+                interfaces.append('pcan')
+            if _has_ixxat_driver():
+                interfaces.append('ixxat')
+            
+            if interfaces:
+                if hasattr(can, 'detect_available_configs'):
+                    try:
+                        configs = can.detect_available_configs(interfaces=interfaces)
+                    except Exception:
+                        # Driver or python-can failure: keep the SocketCAN results
+                        logger.warning("CAN device enumeration failed", exc_info=True)
+                        configs = []
+                    for config in configs:
+                        devices.append((config['interface'].upper(), str(config['channel']), None))
+                else:
+                    devices.extend(self._probe_vendor_channels(interfaces))
+        
+        # Detect SocketCAN interfaces (Linux only)
+        if _IS_LINUX:
+            try:
+                with os.scandir("/sys/class/net") as entries:
+                    channels = [e.name for e in entries
+                                if e.name.startswith(("can", "vcan"))]
+                for channel in sorted(channels):
+                    devices.append(("SocketCAN", channel, _socketcan_state(channel)))
+            except OSError:
+                pass
+        
+        return devices
+    
+    def _probe_vendor_channels(self, interfaces):
+        """Detect PCAN/IXXAT devices by opening each channel in turn
+        
+        Fallback for python-can versions without detect_available_configs.
+        
+        Args:
+            interfaces: python-can interface names whose driver is installed
+        """
         devices = []
         
         # Detect PCAN devices
-        try:
-            import can
+        if 'pcan' in interfaces:
             for i in range(1, 17):  # Check PCAN_USBBUS1-16
                 channel = f"PCAN_USBBUS{i}"
                 try:
                     bus = can.Bus(interface='pcan', channel=channel, bitrate=500000, receive_own_messages=False)
                     bus.shutdown()
-                    devices.append(("PCAN", channel))
-                except:
-                    pass
-        except:
-            pass
+                    devices.append(("PCAN", channel, None))
+                except Exception as e:
+                    logger.debug("PCAN channel %s not available: %s", channel, e)
         
         # Detect IXXAT devices
-        try:
-            import can
+        if 'ixxat' in interfaces:
             for i in range(4):  # Check channels 0-3
                 try:
                     bus = can.Bus(interface='ixxat', channel=i, bitrate=500000, receive_own_messages=False)
                     bus.shutdown()
-                    devices.append(("IXXAT", str(i)))
-                except:
-                    pass  # Channel not available
-        except:
-            pass
-        
-        # Detect SocketCAN interfaces (Linux only)
-        try:
-            import os
-            import platform
-            if platform.system() == "Linux" and os.path.exists("/sys/class/net"):
-                channels = [f for f in os.listdir("/sys/class/net") 
-                          if f.startswith("can") or f.startswith("vcan")]
-                for channel in sorted(channels):
-                    devices.append(("SocketCAN", channel))
-        except:
-            pass
+                    devices.append(("IXXAT", str(i), None))
+                except Exception as e:
+                    logger.debug("IXXAT channel %d not available: %s", i, e)
         
         return devices
     
     def add_interface_dialog(self):
         """Show dialog to add new interface with hardware detection first"""
-        from PyQt5.QtWidgets import QDialog, QDialogButtonBox, QFormLayout, QRadioButton, QButtonGroup, QLabel
-        import can
-        
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Ajouter une interface CAN")
-        dialog.setMinimumWidth(500)
-        
-        layout = QVBoxLayout(dialog)
-        form = QFormLayout()
-        
-        # Name field
-        name_edit = QLineEdit()
-        name_edit.setPlaceholderText("Mon Interface CAN")
-        form.addRow("Nom:", name_edit)
-        
-        # Device selection combo with refresh button
-        device_layout = QHBoxLayout()
-        device_combo = QComboBox()
-        device_combo.setMinimumHeight(32)
-        device_layout.addWidget(device_combo)
-        
-        refresh_btn = QPushButton("⟳")
-        refresh_btn.setFixedSize(32, 32)
-        refresh_btn.setToolTip("Rafraîchir la liste des périphériques")
-        refresh_btn.setCursor(Qt.PointingHandCursor)
-        device_layout.addWidget(refresh_btn)
-        
-        # Manual type selection combo (hidden by default)
-        manual_type_combo = QComboBox()
-        manual_type_combo.addItems(["PCAN", "IXXAT"])
-        manual_type_combo.setMinimumHeight(32)
-        manual_type_combo.hide()
-        
-        # Manual channel input (hidden by default)
-        manual_channel_edit = QLineEdit()
-        manual_channel_edit.setPlaceholderText("Ex: PCAN_USBBUS1 ou 0")
-        manual_channel_edit.hide()
-        
-        # Function to populate device list
-        def populate_devices():
-            """Populate device combo with detected devices"""
-            device_combo.clear()
-            detected_devices = self.detect_hardware_devices()
-            
-            if detected_devices:
-                device_combo.addItem("🔍 Périphériques détectés:", "header")
-                for dev_type, channel in detected_devices:
-                    device_combo.addItem(f"  {dev_type} - {channel}", (dev_type, channel))
-                device_combo.insertSeparator(device_combo.count())
-            else:
-                device_combo.addItem("⚠️ Aucun périphérique détecté", "no_device")
-                device_combo.insertSeparator(device_combo.count())
-            
-            device_combo.addItem("⚙️ Configuration manuelle", "manual")
-            device_combo.insertSeparator(device_combo.count())
-            device_combo.addItem("🖥️ SocketCAN / Virtual", "virtual")
-        
-        # Initial population
-        populate_devices()
-        
-        # Connect refresh button
-        refresh_btn.clicked.connect(populate_devices)
-        
-        form.addRow("Périphérique:", device_layout)
-        
-        # Add manual type row (initially hidden)
-        type_row_label = QLabel("Type:")
-        form.addRow(type_row_label, manual_type_combo)
-        type_row_label.hide()
-        
-        # Add manual channel row (initially hidden)
-        channel_row_label = QLabel("Canal:")
-        form.addRow(channel_row_label, manual_channel_edit)
-        channel_row_label.hide()
-        
-        # Virtual interface options (initially hidden)
-        virtual_type_combo = QComboBox()
-        virtual_type_combo.addItems(["Virtual CAN", "SocketCAN (can0)", "SocketCAN (vcan0)"])
-        virtual_type_combo.setMinimumHeight(32)
-        virtual_type_combo.hide()
-        
-        virtual_row_label = QLabel("Interface:")
-        form.addRow(virtual_row_label, virtual_type_combo)
-        virtual_row_label.hide()
-        
-        # Store interface info
-        selected_interface = {"type": None, "channel": None}
-        
-        def on_device_changed():
-            """Handle device selection change"""
-            current_data = device_combo.currentData()
-            
-            # Hide all manual/virtual options first
-            manual_type_combo.hide()
-            manual_channel_edit.hide()
-            type_row_label.hide()
-            channel_row_label.hide()
-            virtual_type_combo.hide()
-            virtual_row_label.hide()
-            
-            if current_data == "header" or current_data == "no_device":
-                # Header item or no device message, select next valid item
-                device_combo.setCurrentIndex(device_combo.currentIndex() + 1)
-                return
-            elif current_data == "manual":
-                # Show manual configuration
-                manual_type_combo.show()
-                manual_channel_edit.show()
-                type_row_label.show()
-                channel_row_label.show()
-                selected_interface["type"] = manual_type_combo.currentText()
-                selected_interface["channel"] = None
-            elif current_data == "virtual":
-                # Show virtual options
-                virtual_type_combo.show()
-                virtual_row_label.show()
-                selected_interface["type"] = "Virtual"
-                selected_interface["channel"] = "virtual"
-            elif isinstance(current_data, tuple):
-                # Detected device selected
-                dev_type, channel = current_data
-                selected_interface["type"] = dev_type
-                selected_interface["channel"] = channel
-        
-        device_combo.currentIndexChanged.connect(on_device_changed)
-        
-        # Manual type changed
-        def on_manual_type_changed():
-            selected_interface["type"] = manual_type_combo.currentText()
-        
-        manual_type_combo.currentTextChanged.connect(on_manual_type_changed)
-        
-        # Virtual type changed
-        def on_virtual_type_changed():
-            vtype = virtual_type_combo.currentText()
-            if vtype == "Virtual CAN":
-                selected_interface["type"] = "Virtual"
-                selected_interface["channel"] = "virtual"
-            elif "can0" in vtype:
-                selected_interface["type"] = "SocketCAN"
-                selected_interface["channel"] = "can0"
-            elif "vcan0" in vtype:
-                selected_interface["type"] = "SocketCAN"
-                selected_interface["channel"] = "vcan0"
-        
-        virtual_type_combo.currentTextChanged.connect(on_virtual_type_changed)
-        
-        # Initialize with first valid selection
-        on_device_changed()
-        
-        # Bitrate
-        bitrate_combo = QComboBox()
-        bitrate_combo.addItems(["125000", "250000", "500000", "1000000"])
-        bitrate_combo.setCurrentText("500000")
-        bitrate_combo.setMinimumHeight(32)
-        form.addRow("Bitrate:", bitrate_combo)
-        
-        layout.addLayout(form)
-        
-        # Buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.Ok | QDialogButtonBox.Cancel
-        )
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        layout.addWidget(buttons)
+        if self._add_dialog is None:
+            self._add_dialog = _AddInterfaceDialog(self)
+        dialog = self._add_dialog
+        dialog.reset()
         
         if dialog.exec_() == QDialog.Accepted:
-            interface_name = name_edit.text() or f"Interface_{len(self.interfaces)+1}"
-            interface_type = selected_interface["type"]
+            interface_name = dialog.name_edit.text() or f"Interface_{len(self.interfaces)+1}"
+            interface_type = dialog.selected_interface["type"]
             
             # Get channel based on selection mode
-            if device_combo.currentData() == "manual":
-                channel = manual_channel_edit.text()
+            if dialog.device_combo.currentData() == "manual":
+                channel = dialog.manual_channel_edit.text()
                 if not channel:
-                    from PyQt5.QtWidgets import QMessageBox
                     QMessageBox.warning(dialog, "Erreur", "Veuillez saisir un canal")
                     return
             else:
-                channel = selected_interface["channel"]
+                channel = dialog.selected_interface["channel"]
             
             self.add_interface(interface_name, interface_type)
             
@@ -559,8 +915,7 @@ class InterfaceManagerPanel(QWidget):
         widget = CanInterfaceWidget(interface_id, interface_type)
         
         # Connect signals
-        widget.connect_requested.connect(self.on_connect_requested)
-        widget.disconnect_requested.connect(self.on_disconnect_requested)
+        widget.action.connect(self._on_child_action)
         
         self.interfaces[interface_id] = widget
         
@@ -572,6 +927,12 @@ class InterfaceManagerPanel(QWidget):
         
         self.interface_added.emit(interface_id, interface_type)
         
+    def _on_child_action(self, verb, arg):
+        """Route an action emitted by any CanInterfaceWidget"""
+        handler = self._child_action_handlers.get(verb)
+        if handler is not None:
+            handler(arg)
+            
     def on_connect_requested(self, interface_id):
         """Handle connection request"""
         widget = self.interfaces.get(interface_id)
@@ -587,17 +948,52 @@ class InterfaceManagerPanel(QWidget):
         """Handle disconnection request"""
         self.disconnection_requested.emit(interface_id)
         
+    def _queue_update(self, interface_id, key, value):
+        """Record the latest value of an interface update (thread-safe)"""
+        with self._pending_lock:
+            self._pending[interface_id][key] = value
+            
     def set_interface_connected(self, interface_id, connected):
-        """Update interface connection state"""
-        if interface_id in self.interfaces:
-            self.interfaces[interface_id].set_connected(connected)
+        """Update interface connection state (thread-safe, applied on the next drain)"""
+        self._queue_update(interface_id, 'connected', connected)
             
     def update_interface_bus_load(self, interface_id, load_percent):
-        """Update interface bus load"""
-        if interface_id in self.interfaces:
-            self.interfaces[interface_id].update_bus_load(load_percent)
+        """Update interface bus load (thread-safe, applied on the next drain)"""
+        self._queue_update(interface_id, 'load', load_percent)
             
     def update_interface_statistics(self, interface_id, message_count, error_count):
-        """Update interface statistics"""
-        if interface_id in self.interfaces:
-            self.interfaces[interface_id].update_statistics(message_count, error_count)
+        """Update interface statistics (thread-safe, applied on the next drain)"""
+        self._queue_update(interface_id, 'stats', (message_count, error_count))
+        
+    def _drain_updates(self):
+        """Apply all pending interface updates in one GUI-thread pass
+        
+        While the panel is hidden the updates stay pending, only the
+        latest value of each kind being kept; showEvent applies them.
+        """
+        if not self.isVisible():
+            return
+        with self._pending_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, defaultdict(dict)
+        
+        self.interfaces_container.setUpdatesEnabled(False)
+        try:
+            for interface_id, updates in pending.items():
+                widget = self.interfaces.get(interface_id)
+                if widget is None:
+                    continue
+                if 'connected' in updates:
+                    widget.set_connected(updates['connected'])
+                if 'load' in updates:
+                    widget.update_bus_load(updates['load'])
+                if 'stats' in updates:
+                    widget.update_statistics(*updates['stats'])
+        finally:
+            self.interfaces_container.setUpdatesEnabled(True)
+        
+    def showEvent(self, event):
+        """Apply the updates received while the panel was hidden"""
+        super().showEvent(event)
+        self._drain_updates()
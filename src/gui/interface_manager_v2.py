@@ -4,14 +4,78 @@ Vue tabulaire avec expansion pour gestion DBC
 """
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QLabel, QComboBox, QLineEdit, QTableWidget, QTableWidgetItem,
-                             QFrame, QProgressBar, QCheckBox, QMenu, QAction, QMessageBox,
+                             QLabel, QComboBox, QLineEdit,
+                             QFrame, QCheckBox, QMenu, QAction, QMessageBox,
                              QFileDialog, QHeaderView, QDialog, QFormLayout, QDialogButtonBox,
                              QStyledItemDelegate, QStyleOptionButton, QStyle, QApplication,
-                             QTreeWidget, QTreeWidgetItem, QAbstractItemView, QSpinBox)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QRect, QSize, QPoint
+                             QTreeWidget, QTreeWidgetItem, QAbstractItemView, QSpinBox,
+                             QTableView)
+from PyQt5.QtCore import (Qt, pyqtSignal, QTimer, QRect, QSize, QPoint,
+                          QAbstractTableModel, QModelIndex, QEvent)
 from PyQt5.QtGui import QIcon, QColor, QPainter, QBrush, QPen
+import logging
+import os
+import platform
 import time
+from concurrent.futures import ThreadPoolExecutor
+from os.path import basename
+
+from src.gui.interface_manager import HardwareDetectionThread
+
+try:
+    import can
+except ImportError:  # python-can absent : seule la détection SocketCAN reste possible
+    can = None
+
+logger = logging.getLogger(__name__)
+
+_IS_LINUX = platform.system() == "Linux"
+
+# Durée (s) pendant laquelle le résultat de détection matérielle est réutilisé
+DEVICE_CACHE_TTL = 3.0
+
+# Couleurs partagées (évite de recréer QColor/QBrush à chaque mise à jour)
+_COLOR_OK = QColor(0x23, 0x86, 0x36)
+_COLOR_WARN = QColor(0xd2, 0x99, 0x22)
+_COLOR_CRIT = QColor(0xda, 0x36, 0x33)
+_COLOR_GRAY = QColor(0x8b, 0x94, 0x9e)
+_COLOR_TEXT = QColor(0xc9, 0xd1, 0xd9)
+_COLOR_BORDER = QColor(0x30, 0x36, 0x3d)
+_BRUSH_OK = QBrush(_COLOR_OK)
+_BRUSH_WARN = QBrush(_COLOR_WARN)
+_BRUSH_CRIT = QBrush(_COLOR_CRIT)
+_BRUSH_GRAY = QBrush(_COLOR_GRAY)
+_BRUSH_TRACK = QBrush(QColor(0x0d, 0x11, 0x17))
+# Indexed by (load >= 50) + (load >= 80)
+_LOAD_BRUSHES = (_BRUSH_OK, _BRUSH_WARN, _BRUSH_CRIT)
+
+# Styles des boutons d'action (ajout / suppression)
+_BTN_GREEN_CSS = """
+    QPushButton {
+        background-color: #238636;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 6px 12px;
+        font-weight: 500;
+    }
+    QPushButton:hover {
+        background-color: #2ea043;
+    }
+"""
+_BTN_RED_CSS = """
+    QPushButton {
+        background-color: #da3633;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 6px 12px;
+        font-weight: 500;
+    }
+    QPushButton:hover {
+        background-color: #e5534b;
+    }
+"""
 
 
 class CheckBoxDelegate(QStyledItemDelegate):
@@ -19,29 +83,35 @@ class CheckBoxDelegate(QStyledItemDelegate):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.checked_rows = set()
+        # Indicator size only depends on the style, option reused for each paint
+        self._style = None
+        self._indicator_size = QSize()
+        self._checkbox_option = QStyleOptionButton()
     
     def paint(self, painter, option, index):
         """Draw checkbox"""
+        style = QApplication.style()
+        if style is not self._style:
+            self._style = style
+            self._indicator_size = style.subElementRect(
+                QStyle.SE_CheckBoxIndicator,
+                QStyleOptionButton(),
+                None
+            ).size()
+        
         # Center checkbox
-        checkbox_rect = QApplication.style().subElementRect(
-            QStyle.SE_CheckBoxIndicator, 
-            option, 
-            None
-        )
+        checkbox_rect = QRect(QPoint(0, 0), self._indicator_size)
         checkbox_rect.moveCenter(option.rect.center())
         
         # Draw checkbox
-        checkbox_option = QStyleOptionButton()
+        checkbox_option = self._checkbox_option
         checkbox_option.rect = checkbox_rect
         checkbox_option.state = QStyle.State_Enabled
         
-        if index.row() in self.checked_rows:
-            checkbox_option.state |= QStyle.State_On
-        else:
-            checkbox_option.state |= QStyle.State_Off
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        checkbox_option.state |= QStyle.State_On if checked else QStyle.State_Off
         
-        QApplication.style().drawControl(
+        style.drawControl(
             QStyle.CE_CheckBox,
             checkbox_option,
             painter
@@ -49,48 +119,286 @@ class CheckBoxDelegate(QStyledItemDelegate):
     
     def editorEvent(self, event, model, option, index):
         """Handle click on checkbox"""
-        if event.type() == event.MouseButtonRelease:
-            if index.row() in self.checked_rows:
-                self.checked_rows.remove(index.row())
-            else:
-                self.checked_rows.add(index.row())
-            return True
+        if event.type() == QEvent.MouseButtonRelease and index.flags() & Qt.ItemIsUserCheckable:
+            checked = index.data(Qt.CheckStateRole) == Qt.Checked
+            return model.setData(index, Qt.Unchecked if checked else Qt.Checked,
+                                 Qt.CheckStateRole)
         return False
 
 
-class InterfaceTableWidget(QTableWidget):
-    """Custom table widget for CAN interfaces"""
+class InterfaceTableModel(QAbstractTableModel):
+    """Table model holding the CAN interface configs"""
+    
+    enabled_toggled = pyqtSignal(int, bool)  # row, enabled (user checkbox click only)
+    
+    HEADERS = ["✓", "Nom", "Type", "Canal", "Débit", "Bus Load", "État"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []  # Interface configs (shared with the panel)
+        self._status = []  # Per-row runtime state: {'connected': bool, 'bus_load': float}
+        self._row_by_name = {}  # Interface name -> row, kept in sync with rows
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        if index.column() == 0:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        column = index.column()
+        config = self.rows[row]
+        
+        if role == Qt.DisplayRole:
+            if column == 1:
+                return config['name']
+            if column == 2:
+                return config['type']
+            if column == 3:
+                return config['channel']
+            if column == 4:
+                return _format_bitrate(config['bitrate'])
+            if column == 5:
+                return f"{int(self._status[row]['bus_load'])}%"
+            if column == 6:
+                return "● Connecté" if self._status[row]['connected'] else "● Déconnecté"
+        elif role == Qt.UserRole and column == 5:
+            return self._status[row]['bus_load']
+        elif role == Qt.ToolTipRole and column == 5 and 'messages' in self._status[row]:
+            return f"Messages: {self._status[row]['messages']}\nErreurs: {self._status[row]['errors']}"
+        elif role == Qt.CheckStateRole and column == 0:
+            return Qt.Checked if config.get('enabled', False) else Qt.Unchecked
+        elif role == Qt.ForegroundRole and column == 6:
+            return _BRUSH_OK if self._status[row]['connected'] else _BRUSH_GRAY
+        elif role == Qt.TextAlignmentRole and column in (0, 2, 3, 4):
+            return Qt.AlignCenter
+        return None
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        row = index.row()
+        column = index.column()
+        
+        if role == Qt.CheckStateRole and column == 0:
+            enabled = value == Qt.Checked
+            if enabled == self.rows[row].get('enabled', False):
+                return True
+            self.rows[row]['enabled'] = enabled
+            self.dataChanged.emit(index, index, [role])
+            self.enabled_toggled.emit(row, enabled)
+            return True
+        elif role == Qt.UserRole and column == 5:
+            previous = self._status[row]['bus_load']
+            self._status[row]['bus_load'] = value
+            if int(previous) == int(value):
+                return True  # Same percentage shown, nothing to repaint
+        else:
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+    
+    def set_connected(self, row, connected):
+        """Update the connection state of a row"""
+        self._status[row]['connected'] = connected
+        index = self.index(row, 6)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.ForegroundRole])
+    
+    def set_statistics(self, row, message_count, error_count):
+        """Update the message/error counters of a row"""
+        self._status[row]['messages'] = message_count
+        self._status[row]['errors'] = error_count
+        index = self.index(row, 5)
+        self.dataChanged.emit(index, index, [Qt.ToolTipRole])
+    
+    def append_row(self, config):
+        """Append an interface config, returns its row"""
+        if config['name'] in self._row_by_name:
+            raise ValueError(f"Duplicate interface name: {config['name']}")
+        row = len(self.rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rows.append(config)
+        self._status.append({'connected': False, 'bus_load': 0.0})
+        self._row_by_name[config['name']] = row
+        self.endInsertRows()
+        return row
+    
+    def append_rows(self, configs):
+        """Append several interface configs in a single insert"""
+        if not configs:
+            return
+        names = {config['name'] for config in configs}
+        if len(names) != len(configs) or not names.isdisjoint(self._row_by_name):
+            raise ValueError("Duplicate interface name")
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(configs) - 1)
+        self.rows.extend(configs)
+        self._status.extend({'connected': False, 'bus_load': 0.0} for _ in configs)
+        self._reindex(first)
+        self.endInsertRows()
+    
+    def remove_row(self, row):
+        """Remove the interface at row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._row_by_name.pop(self.rows[row]['name'], None)
+        del self.rows[row]
+        del self._status[row]
+        self._reindex(row)
+        self.endRemoveRows()
+    
+    def refresh_row(self, row, old_name=None):
+        """Notify views that a row config was modified in place
+        
+        Args:
+            old_name: Previous interface name if it was renamed
+        """
+        if old_name is not None:
+            self._row_by_name.pop(old_name, None)
+            self._row_by_name[self.rows[row]['name']] = row
+        # Only name/type/channel/bitrate come from the edited config
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 4), [Qt.DisplayRole])
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort rows in place so that view rows keep matching model rows"""
+        keys = {
+            0: lambda item: item[0].get('enabled', False),
+            1: lambda item: item[0]['name'],
+            2: lambda item: item[0]['type'],
+            3: lambda item: item[0]['channel'],
+            4: lambda item: item[0]['bitrate'],
+            5: lambda item: item[1]['bus_load'],
+            6: lambda item: item[1]['connected'],
+        }
+        key = keys.get(column)
+        if key is None:
+            return
+        self.layoutAboutToBeChanged.emit()
+        items = sorted(zip(self.rows, self._status), key=key,
+                       reverse=order == Qt.DescendingOrder)
+        self.rows[:] = [config for config, _ in items]
+        self._status[:] = [status for _, status in items]
+        self._reindex()
+        self.layoutChanged.emit()
+    
+    def _reindex(self, start=0):
+        """Rebuild the name -> row index from start onwards"""
+        for row in range(start, len(self.rows)):
+            self._row_by_name[self.rows[row]['name']] = row
+    
+    def row_of(self, name):
+        """Row of the interface called name, or None"""
+        return self._row_by_name.get(name)
+
+
+class BusLoadDelegate(QStyledItemDelegate):
+    """Delegate drawing the bus load as a progress bar"""
+    
+    def paint(self, painter, option, index):
+        """Draw progress bar"""
+        load_percent = int(index.data(Qt.UserRole) or 0)
+        
+        rect = option.rect.adjusted(4, 4, -4, -4)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Background
+        painter.setPen(_COLOR_BORDER)
+        painter.setBrush(_BRUSH_TRACK)
+        painter.drawRoundedRect(rect, 4, 4)
+        
+        # Chunk
+        width = int(rect.width() * min(load_percent, 100) / 100)
+        if width > 0:
+            painter.setPen(Qt.NoPen)
+            # Couleur selon la charge
+            painter.setBrush(_LOAD_BRUSHES[(load_percent >= 50) + (load_percent >= 80)])
+            painter.drawRoundedRect(QRect(rect.left(), rect.top(), width, rect.height()), 3, 3)
+        
+        # Text
+        painter.setPen(_COLOR_TEXT)
+        painter.drawText(rect, Qt.AlignCenter, f"{int(load_percent)}%")
+        painter.restore()
+
+
+class InterfaceTableWidget(QTableView):
+    """Custom table view for CAN interfaces"""
     
     interface_toggled = pyqtSignal(int, bool)  # row, enabled
     interface_edited = pyqtSignal(int)  # row
     interface_deleted = pyqtSignal(int)  # row
     dbc_section_toggled = pyqtSignal(int, bool)  # row, expanded
     
+    CONTEXT_MENU_STYLE = """
+        QMenu {
+            background-color: #161b22;
+            color: #c9d1d9;
+            border: 1px solid #30363d;
+            border-radius: 6px;
+            padding: 4px;
+        }
+        QMenu::item {
+            padding: 6px 24px 6px 12px;
+            border-radius: 4px;
+        }
+        QMenu::item:selected {
+            background-color: #1f6feb;
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.interface_data = []  # List of interface configs
-        self.expanded_rows = set()
+        self.interface_model = InterfaceTableModel(self)
+        self.interface_model.enabled_toggled.connect(self.interface_toggled)
+        self.setModel(self.interface_model)
+        # Expanded flag per row, kept the same length as the model
+        self._expanded = bytearray()
+        self.interface_model.rowsInserted.connect(self._on_rows_inserted)
+        self.interface_model.rowsRemoved.connect(self._on_rows_removed)
+        self.interface_model.layoutChanged.connect(self._on_layout_changed)
         
         self.setup_table()
     
+    @property
+    def interface_data(self):
+        """List of interface configs, in row order"""
+        return self.interface_model.rows
+    
     def setup_table(self):
         """Configure table appearance"""
-        self.setColumnCount(7)
-        self.setHorizontalHeaderLabels([
-            "✓", "Nom", "Type", "Canal", "Débit", "Bus Load", "État"
-        ])
-        
         # Set column widths
         header = self.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Fixed)  # Checkbox
         header.setSectionResizeMode(1, QHeaderView.Stretch)  # Name
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)  # Type
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)  # Channel
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)  # Bitrate
+        header.setSectionResizeMode(2, QHeaderView.Interactive)  # Type
+        header.setSectionResizeMode(3, QHeaderView.Interactive)  # Channel
+        header.setSectionResizeMode(4, QHeaderView.Interactive)  # Bitrate
         header.setSectionResizeMode(5, QHeaderView.Stretch)  # Bus Load
-        header.setSectionResizeMode(6, QHeaderView.ResizeToContents)  # Status
+        header.setSectionResizeMode(6, QHeaderView.Interactive)  # Status
         
+        # Fixed initial widths, no per-row content measurement
         self.setColumnWidth(0, 40)
+        self.setColumnWidth(2, 90)
+        self.setColumnWidth(3, 90)
+        self.setColumnWidth(4, 100)
+        self.setColumnWidth(6, 110)
+        
+        # Enabled checkbox and bus load drawn by delegates, no widget per row
+        self.setItemDelegateForColumn(0, CheckBoxDelegate(self))
+        self.setItemDelegateForColumn(5, BusLoadDelegate(self))
         
         # Style
         self.setAlternatingRowColors(True)
@@ -99,132 +407,89 @@ class InterfaceTableWidget(QTableWidget):
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
         
-        # Enable sorting
+        # Enable sorting (no column sorted until the user clicks a header)
+        header.setSortIndicator(-1, Qt.AscendingOrder)
         self.setSortingEnabled(True)
         
+    def _on_rows_inserted(self, parent, first, last):
+        self._expanded[first:first] = bytes(last - first + 1)
+    
+    def _on_rows_removed(self, parent, first, last):
+        del self._expanded[first:last + 1]
+    
+    def _on_layout_changed(self):
+        # Rows were reordered, collapse everything
+        self._expanded = bytearray(self.interface_model.rowCount())
+    
     def add_interface(self, interface_config):
         """Add an interface to the table
         
         Args:
             interface_config: dict with keys: name, type, channel, bitrate, enabled
         """
-        row = self.rowCount()
-        self.insertRow(row)
-        
-        # Store config
-        self.interface_data.append(interface_config)
-        
-        # Checkbox column
-        checkbox_item = QTableWidgetItem()
-        checkbox_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
-        checkbox_item.setCheckState(Qt.Checked if interface_config.get('enabled', False) else Qt.Unchecked)
-        checkbox_item.setTextAlignment(Qt.AlignCenter)
-        self.setItem(row, 0, checkbox_item)
-        
-        # Name
-        name_item = QTableWidgetItem(interface_config['name'])
-        self.setItem(row, 1, name_item)
-        
-        # Type
-        type_item = QTableWidgetItem(interface_config['type'])
-        type_item.setTextAlignment(Qt.AlignCenter)
-        self.setItem(row, 2, type_item)
-        
-        # Channel
-        channel_item = QTableWidgetItem(interface_config['channel'])
-        channel_item.setTextAlignment(Qt.AlignCenter)
-        self.setItem(row, 3, channel_item)
-        
-        # Bitrate (format appropriately)
-        bitrate = interface_config['bitrate']
-        if bitrate >= 1000000:
-            bitrate_text = f"{bitrate / 1000000:.1f} Mbit/s"
-        elif bitrate >= 1000:
-            bitrate_text = f"{bitrate / 1000:.0f} kbit/s"
-        else:
-            bitrate_text = f"{bitrate} bit/s"
-        bitrate_item = QTableWidgetItem(bitrate_text)
-        bitrate_item.setTextAlignment(Qt.AlignCenter)
-        self.setItem(row, 4, bitrate_item)
-        
-        # Bus Load (progress bar)
-        bus_load_item = QTableWidgetItem("")
-        self.setItem(row, 5, bus_load_item)
-        
-        progress = QProgressBar()
-        progress.setMinimum(0)
-        progress.setMaximum(100)
-        progress.setValue(0)
-        progress.setTextVisible(True)
-        progress.setFormat("%p%")
-        progress.setFixedHeight(20)
-        self.setCellWidget(row, 5, progress)
-        
-        # Status
-        status_item = QTableWidgetItem("● Déconnecté")
-        status_item.setForeground(QColor("#8b949e"))
-        self.setItem(row, 6, status_item)
-        
-        return row
+        return self.interface_model.append_row(interface_config)
+    
+    def add_interfaces(self, interface_configs):
+        """Add several interfaces at once"""
+        self.begin_bulk_insert()
+        try:
+            self.interface_model.append_rows(interface_configs)
+        finally:
+            self.end_bulk_insert()
+    
+    def begin_bulk_insert(self):
+        """Suspend sorting and repaints while rows are inserted"""
+        self.setSortingEnabled(False)
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+    
+    def end_bulk_insert(self):
+        """Resume sorting and repaints after a bulk insert"""
+        self.blockSignals(False)
+        self.setUpdatesEnabled(True)
+        # Re-sorts once by the current header indicator, if any
+        self.setSortingEnabled(True)
+        self.viewport().update()
+    
+    def remove_interface(self, row):
+        """Remove the interface at row"""
+        self.interface_model.remove_row(row)
+    
+    def refresh_interface(self, row, old_name=None):
+        """Redraw a row after its config was modified in place"""
+        self.interface_model.refresh_row(row, old_name)
+    
+    def row_of(self, name):
+        """Row of the interface called name, or None"""
+        return self.interface_model.row_of(name)
     
     def update_bus_load(self, row, load_percent):
         """Update bus load for a row"""
-        if row < self.rowCount():
-            progress = self.cellWidget(row, 5)
-            if progress:
-                progress.setValue(int(load_percent))
-                
-                # Update color
-                if load_percent < 50:
-                    color = "#238636"
-                elif load_percent < 80:
-                    color = "#d29922"
-                else:
-                    color = "#da3633"
-                
-                progress.setStyleSheet(f"""
-                    QProgressBar::chunk {{
-                        background-color: {color};
-                        border-radius: 3px;
-                    }}
-                """)
+        if row < self.interface_model.rowCount():
+            self.interface_model.setData(
+                self.interface_model.index(row, 5), load_percent, Qt.UserRole
+            )
+    
+    def update_statistics(self, row, message_count, error_count):
+        """Update message/error counters for a row"""
+        if row < self.interface_model.rowCount():
+            self.interface_model.set_statistics(row, message_count, error_count)
     
     def update_status(self, row, connected, message=""):
         """Update connection status"""
-        if row < self.rowCount():
-            status_item = self.item(row, 6)
-            if connected:
-                status_item.setText("● Connecté")
-                status_item.setForeground(QColor("#238636"))
-            else:
-                status_item.setText("● Déconnecté")
-                status_item.setForeground(QColor("#8b949e"))
+        if row < self.interface_model.rowCount():
+            self.interface_model.set_connected(row, connected)
     
     def show_context_menu(self, pos):
         """Show context menu on row"""
-        item = self.itemAt(pos)
-        if not item:
+        index = self.indexAt(pos)
+        if not index.isValid():
             return
         
-        row = item.row()
+        row = index.row()
         
         menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #161b22;
-                color: #c9d1d9;
-                border: 1px solid #30363d;
-                border-radius: 6px;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 6px 24px 6px 12px;
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background-color: #1f6feb;
-            }
-        """)
+        menu.setStyleSheet(self.CONTEXT_MENU_STYLE)
         
         edit_action = menu.addAction("✏️ Éditer")
         dbc_action = menu.addAction("📁 Gérer les DBC")
@@ -242,16 +507,311 @@ class InterfaceTableWidget(QTableWidget):
     
     def toggle_dbc_section(self, row):
         """Toggle DBC management section for a row"""
-        if row in self.expanded_rows:
-            self.expanded_rows.remove(row)
-            # Remove DBC widget if exists
-            # TODO: Implement collapsible section
+        self._expanded[row] ^= 1
+        # TODO: Implement collapsible section (show/remove DBC widget)
+        
+        self.dbc_section_toggled.emit(row, bool(self._expanded[row]))
+
+
+# Libellés précalculés des débits CAN usuels
+_BITRATE_LABELS = {
+    10000: "10 kbit/s", 20000: "20 kbit/s", 50000: "50 kbit/s",
+    125000: "125 kbit/s", 250000: "250 kbit/s", 500000: "500 kbit/s",
+    1000000: "1.0 Mbit/s", 2000000: "2.0 Mbit/s",
+    5000000: "5.0 Mbit/s", 8000000: "8.0 Mbit/s",
+}
+
+
+def _format_bitrate(bitrate):
+    """Format a bitrate for display (e.g. "500 kbit/s")"""
+    label = _BITRATE_LABELS.get(bitrate)
+    if label is not None:
+        return label
+    if bitrate >= 1000000:
+        return f"{bitrate / 1000000:.1f} Mbit/s"
+    elif bitrate >= 1000:
+        return f"{bitrate / 1000:.0f} kbit/s"
+    return f"{bitrate} bit/s"
+
+
+def _dbc_entry(path):
+    """Build a DBC list entry, the file name is computed once here"""
+    return {'path': path, 'name': basename(path)}
+
+
+def _probe_channel(interface, channel):
+    """Try to open a vendor CAN channel, returns True if the device answered"""
+    try:
+        bus = can.Bus(interface=interface, channel=channel, bitrate=500000, receive_own_messages=False)
+        bus.shutdown()
+        return True
+    except (can.CanError, OSError, ImportError) as e:
+        # No device on this channel, or the vendor driver is not installed
+        logger.debug("%s channel %s not available: %s", interface, channel, e)
+        return False
+    except Exception:
+        logger.debug("Probing %s channel %s failed", interface, channel, exc_info=True)
+        return False
+
+
+def _probe_vendor_channels():
+    """Detect PCAN/IXXAT devices by opening each channel in turn
+    
+    Fallback for python-can versions without detect_available_configs.
+    """
+    devices = []
+    
+    # Detect PCAN devices, each open waits on USB so probe them concurrently
+    pcan_channels = [f"PCAN_USBBUS{i}" for i in range(1, 17)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        found = pool.map(lambda channel: _probe_channel('pcan', channel), pcan_channels)
+        devices.extend(("PCAN", channel) for channel, ok in zip(pcan_channels, found) if ok)
+    
+    # Detect IXXAT devices
+    for i in range(4):
+        if _probe_channel('ixxat', i):
+            devices.append(("IXXAT", str(i)))
+    
+    return devices
+
+
+def detect_hardware_devices():
+    """Detect all connected CAN hardware devices (blocking, run it off the GUI thread)
+    
+    Returns:
+        List of (type, channel) tuples
+    """
+    devices = []
+    
+    if can is not None:
+        if hasattr(can, 'detect_available_configs'):
+            # Single enumeration query per driver (PCAN attached channels,
+            # IXXAT VCI device list) instead of opening every channel
+            try:
+                configs = can.detect_available_configs(interfaces=['pcan', 'ixxat'])
+            except Exception:
+                # Driver or python-can failure: keep the SocketCAN results
+                logger.warning("CAN device enumeration failed", exc_info=True)
+                configs = []
+            for config in configs:
+                devices.append((config['interface'].upper(), str(config['channel'])))
+        else:
+            devices.extend(_probe_vendor_channels())
+    
+    # Detect SocketCAN interfaces (Linux only)
+    if _IS_LINUX:
+        try:
+            with os.scandir("/sys/class/net") as entries:
+                channels = [e.name for e in entries
+                            if e.name.startswith(("can", "vcan"))]
+        except OSError:
+            channels = []
+        for channel in sorted(channels):
+            devices.append(("SocketCAN", channel))
+    
+    return devices
+
+
+class _AddInterfaceDialog(QDialog):
+    """Dialogue d'ajout d'interface, construit une fois et réutilisé"""
+    
+    def __init__(self, panel):
+        super().__init__(panel)
+        self.panel = panel
+        self.selected_interface = {"type": None, "channel": None}
+        
+        self.setWindowTitle("Ajouter une interface CAN")
+        self.setMinimumWidth(500)
+        
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        
+        # Name
+        self.name_edit = QLineEdit()
+        self.name_edit.setPlaceholderText("Mon Interface CAN")
+        form.addRow("Nom:", self.name_edit)
+        
+        # Device selection with refresh
+        device_layout = QHBoxLayout()
+        self.device_combo = QComboBox()
+        self.device_combo.setMinimumHeight(32)
+        device_layout.addWidget(self.device_combo)
+        
+        refresh_btn = QPushButton("⟳")
+        refresh_btn.setFixedSize(32, 32)
+        refresh_btn.setToolTip("Rafraîchir la liste des périphériques")
+        refresh_btn.setCursor(Qt.PointingHandCursor)
+        device_layout.addWidget(refresh_btn)
+        
+        # Rapid clicks are served from the cache
+        refresh_btn.clicked.connect(lambda: self.populate_devices(panel.refresh_hardware_devices()))
+        panel.hardware_devices_changed.connect(self.on_devices_detected)
+        
+        form.addRow("Périphérique:", device_layout)
+        
+        # Manual configuration
+        self.manual_type_combo = QComboBox()
+        self.manual_type_combo.addItems(["PCAN", "IXXAT"])
+        self.manual_type_combo.setMinimumHeight(32)
+        self.manual_type_combo.hide()
+        
+        self.manual_channel_edit = QLineEdit()
+        self.manual_channel_edit.setPlaceholderText("Ex: PCAN_USBBUS1 ou 0")
+        self.manual_channel_edit.hide()
+        
+        # Virtual options
+        self.virtual_type_combo = QComboBox()
+        self.virtual_type_combo.addItems(["Virtual CAN", "SocketCAN (can0)", "SocketCAN (vcan0)"])
+        self.virtual_type_combo.setMinimumHeight(32)
+        self.virtual_type_combo.hide()
+        
+        # Manual type/channel rows
+        self.type_row_label = QLabel("Type:")
+        form.addRow(self.type_row_label, self.manual_type_combo)
+        self.type_row_label.hide()
+        
+        self.channel_row_label = QLabel("Canal:")
+        form.addRow(self.channel_row_label, self.manual_channel_edit)
+        self.channel_row_label.hide()
+        
+        # Virtual row
+        self.virtual_row_label = QLabel("Interface:")
+        form.addRow(self.virtual_row_label, self.virtual_type_combo)
+        self.virtual_row_label.hide()
+        
+        self.device_combo.currentIndexChanged.connect(self.on_device_changed)
+        self.manual_type_combo.currentTextChanged.connect(self.on_manual_type_changed)
+        self.virtual_type_combo.currentTextChanged.connect(self.on_virtual_type_changed)
+        
+        # Bitrate
+        self.bitrate_spin = QSpinBox()
+        self.bitrate_spin.setMinimum(10000)
+        self.bitrate_spin.setMaximum(5000000)
+        self.bitrate_spin.setSingleStep(125000)
+        self.bitrate_spin.setValue(500000)
+        self.bitrate_spin.setSuffix(" bit/s")
+        self.bitrate_spin.setMinimumHeight(32)
+        form.addRow("Débit:", self.bitrate_spin)
+        
+        layout.addLayout(form)
+        
+        # Buttons
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+    
+    def reset(self):
+        """Prepare the dialog for a new interface"""
+        self.name_edit.clear()
+        self.manual_channel_edit.clear()
+        self.manual_type_combo.setCurrentIndex(0)
+        self.virtual_type_combo.setCurrentIndex(0)
+        self.selected_interface = {"type": None, "channel": None}
+        self.bitrate_spin.setValue(500000)
+        self.populate_devices(self.panel.refresh_hardware_devices(force=True))
+    
+    def on_devices_detected(self, devices):
+        """Refill the device list when a probe completes while the dialog is open"""
+        if self.isVisible():
+            self.populate_devices(devices)
+    
+    def populate_devices(self, detected_devices):
+        """Fill the device combo, None showing a placeholder until the probe answers"""
+        device_combo = self.device_combo
+        previous = device_combo.currentData()
+        
+        device_combo.blockSignals(True)
+        device_combo.clear()
+        
+        if detected_devices is None:
+            device_combo.addItem("⏳ Recherche des périphériques…", "header")
+            device_combo.insertSeparator(device_combo.count())
+        elif detected_devices:
+            device_combo.addItem("🔍 Périphériques détectés:", "header")
+            for dev_type, channel in detected_devices:
+                device_combo.addItem(f"  {dev_type} - {channel}", (dev_type, channel))
+            device_combo.insertSeparator(device_combo.count())
         else:
-            self.expanded_rows.add(row)
-            # Show DBC widget
-            # TODO: Implement collapsible section
+            device_combo.addItem("⚠️ Aucun périphérique détecté", "no_device")
+            device_combo.insertSeparator(device_combo.count())
         
-        self.dbc_section_toggled.emit(row, row in self.expanded_rows)
+        device_combo.addItem("⚙️ Configuration manuelle", "manual")
+        device_combo.insertSeparator(device_combo.count())
+        device_combo.addItem("🖥️ SocketCAN / Virtual", "virtual")
+        
+        # Informative rows cannot be selected (separators already are disabled)
+        model = device_combo.model()
+        selectable = []
+        for row in range(device_combo.count()):
+            data = device_combo.itemData(row)
+            if data in ("header", "no_device"):
+                model.item(row).setEnabled(False)
+            elif model.item(row).isEnabled():
+                selectable.append(row)
+        
+        # Keep the choice made while the probe was running, else the first selectable row
+        current = next((row for row in selectable if device_combo.itemData(row) == previous),
+                       selectable[0])
+        device_combo.setCurrentIndex(current)
+        device_combo.blockSignals(False)
+        self.on_device_changed()
+    
+    def on_device_changed(self):
+        """Handle device selection change"""
+        current_data = self.device_combo.currentData()
+        
+        self.manual_type_combo.hide()
+        self.manual_channel_edit.hide()
+        self.type_row_label.hide()
+        self.channel_row_label.hide()
+        self.virtual_type_combo.hide()
+        self.virtual_row_label.hide()
+        
+        if current_data == "manual":
+            self.manual_type_combo.show()
+            self.manual_channel_edit.show()
+            self.type_row_label.show()
+            self.channel_row_label.show()
+            self.selected_interface["type"] = self.manual_type_combo.currentText()
+            self.selected_interface["channel"] = None
+        elif current_data == "virtual":
+            self.virtual_type_combo.show()
+            self.virtual_row_label.show()
+            # Follow the visible virtual option
+            self.on_virtual_type_changed()
+        elif isinstance(current_data, tuple):
+            dev_type, channel = current_data
+            self.selected_interface["type"] = dev_type
+            self.selected_interface["channel"] = channel
+    
+    def on_manual_type_changed(self):
+        """Manual type changed"""
+        self.selected_interface["type"] = self.manual_type_combo.currentText()
+    
+    def on_virtual_type_changed(self):
+        """Virtual type changed"""
+        vtype = self.virtual_type_combo.currentText()
+        if vtype == "Virtual CAN":
+            self.selected_interface["type"] = "Virtual"
+            self.selected_interface["channel"] = "virtual"
+        elif "can0" in vtype:
+            self.selected_interface["type"] = "SocketCAN"
+            self.selected_interface["channel"] = "can0"
+        elif "vcan0" in vtype:
+            self.selected_interface["type"] = "SocketCAN"
+            self.selected_interface["channel"] = "vcan0"
+    
+    def accept(self):
+        """Refuse to close until an interface type is selected"""
+        if self.selected_interface["type"] is None:
+            QMessageBox.warning(self, "Erreur", "Veuillez sélectionner un périphérique")
+            return
+        name = self.name_edit.text()
+        if name in self.panel.interfaces:
+            QMessageBox.warning(self, "Erreur", f"Une interface nommée '{name}' existe déjà")
+            return
+        super().accept()
 
 
 class InterfaceManagerPanel(QWidget):
@@ -262,12 +822,26 @@ class InterfaceManagerPanel(QWidget):
     connection_requested = pyqtSignal(str, str, str)  # interface_id, interface_type, db_path
     disconnection_requested = pyqtSignal(str)
     database_changed = pyqtSignal(str, str)  # interface_id, db_path
+    hardware_devices_changed = pyqtSignal(list)  # [(type, channel), ...]
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.interfaces = {}  # interface_id -> config with 'dbc_files': []
+        self.interfaces = {}  # interface_id -> config with 'dbc_files': [{'path', 'name'}]
+        self._detection_thread = None
+        self._device_cache = None
+        self._device_cache_ts = 0.0
+        self._add_dialog = None  # _AddInterfaceDialog, built on first use
+        # Latest values received since the last flush, interface_id -> value
+        self._pending_bus_load = {}
+        self._pending_statistics = {}
         self.init_ui()
         
+        # Apply buffered updates at ~30 Hz whatever the input rate
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(33)
+        self._flush_timer.timeout.connect(self._flush_updates)
+        self._flush_timer.start()
+        
     def init_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -291,19 +865,7 @@ class InterfaceManagerPanel(QWidget):
         add_btn = QPushButton("+ Ajouter")
         add_btn.clicked.connect(self.add_interface_dialog)
         add_btn.setCursor(Qt.PointingHandCursor)
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #238636;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #2ea043;
-            }
-        """)
+        add_btn.setStyleSheet(_BTN_GREEN_CSS)
         header_layout.addWidget(add_btn)
         
         layout.addWidget(header)
@@ -313,244 +875,130 @@ class InterfaceManagerPanel(QWidget):
         self.table.interface_edited.connect(self.edit_interface)
         self.table.interface_deleted.connect(self.delete_interface)
         self.table.dbc_section_toggled.connect(self.on_dbc_section_toggled)
-        self.table.itemChanged.connect(self.on_item_changed)
+        self.table.interface_toggled.connect(self.on_interface_toggled)
         
         layout.addWidget(self.table)
         
-    def on_item_changed(self, item):
-        """Handle item change (checkbox toggle)"""
-        if item.column() == 0:  # Checkbox column
-            row = item.row()
-            enabled = item.checkState() == Qt.Checked
+    def on_interface_toggled(self, row, enabled):
+        """Handle checkbox toggle"""
+        # Emit connection/disconnection signal
+        if row < len(self.table.interface_data):
+            interface_id = self.table.interface_data[row].get('name', f"Interface_{row}")
             
-            # Emit connection/disconnection signal
-            if row < len(self.table.interface_data):
-                interface_id = self.table.interface_data[row].get('name', f"Interface_{row}")
-                
-                if enabled:
-                    interface_type = self.table.interface_data[row]['type']
-                    self.connection_requested.emit(interface_id, interface_type, "")
-                else:
-                    self.disconnection_requested.emit(interface_id)
+            if enabled:
+                interface_type = self.table.interface_data[row]['type']
+                self.connection_requested.emit(interface_id, interface_type, "")
+            else:
+                self.disconnection_requested.emit(interface_id)
     
-    def detect_hardware_devices(self):
-        """Detect all connected CAN hardware devices"""
-        devices = []
+    def refresh_hardware_devices(self, force=False):
+        """Get the detected hardware, probing in the background if the cache is stale
         
-        # Detect PCAN devices
-        try:
-            import can
-            for i in range(1, 17):
-                channel = f"PCAN_USBBUS{i}"
-                try:
-                    bus = can.Bus(interface='pcan', channel=channel, bitrate=500000, receive_own_messages=False)
-                    bus.shutdown()
-                    devices.append(("PCAN", channel))
-                except:
-                    pass
-        except:
-            pass
-        
-        # Detect IXXAT devices
-        try:
-            import can
-            for i in range(4):
-                try:
-                    bus = can.Bus(interface='ixxat', channel=i, bitrate=500000, receive_own_messages=False)
-                    bus.shutdown()
-                    devices.append(("IXXAT", str(i)))
-                except:
-                    pass
-        except:
-            pass
-        
-        # Detect SocketCAN interfaces (Linux only)
-        try:
-            import os
-            import platform
-            if platform.system() == "Linux" and os.path.exists("/sys/class/net"):
-                channels = [f for f in os.listdir("/sys/class/net") 
-                          if f.startswith("can") or f.startswith("vcan")]
-                for channel in sorted(channels):
-                    devices.append(("SocketCAN", channel))
-        except:
-            pass
-        
-        return devices
+        Args:
+            force: Probe even if the cached result is still fresh
+        
+        Returns:
+            Cached list of (type, channel) tuples, or None when a probe was
+            started (result delivered by hardware_devices_changed)
+        """
+        if (not force and self._device_cache is not None and
+                time.monotonic() - self._device_cache_ts < DEVICE_CACHE_TTL):
+            return self._device_cache
+        if self._detection_thread is not None:
+            return None  # Probe already running
+        
+        thread = HardwareDetectionThread(detect_hardware_devices, self)
+        thread.devices_detected.connect(self._on_devices_detected)
+        thread.finished.connect(self._on_detection_finished)
+        thread.finished.connect(thread.deleteLater)
+        self._detection_thread = thread
+        thread.start()
+        return None
+    
+    def _on_detection_finished(self):
+        """Allow the next probe once the detection thread has exited"""
+        self._detection_thread = None
+    
+    def stop_hardware_detection(self):
+        """Wait for a running probe, the thread must not outlive the panel"""
+        if self._detection_thread is not None:
+            self._detection_thread.wait()
+    
+    def event(self, event):
+        if event.type() == QEvent.DeferredDelete:
+            self.stop_hardware_detection()
+        return super().event(event)
+    
+    def _on_devices_detected(self, devices):
+        """Cache and forward the probe result"""
+        self._device_cache = devices
+        self._device_cache_ts = time.monotonic()
+        self.hardware_devices_changed.emit(devices)
     
     def add_interface_dialog(self):
         """Show dialog to add new interface"""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Ajouter une interface CAN")
-        dialog.setMinimumWidth(500)
-        
-        layout = QVBoxLayout(dialog)
-        form = QFormLayout()
-        
-        # Name
-        name_edit = QLineEdit()
-        name_edit.setPlaceholderText("Mon Interface CAN")
-        form.addRow("Nom:", name_edit)
-        
-        # Device selection with refresh
-        device_layout = QHBoxLayout()
-        device_combo = QComboBox()
-        device_combo.setMinimumHeight(32)
-        device_layout.addWidget(device_combo)
-        
-        refresh_btn = QPushButton("⟳")
-        refresh_btn.setFixedSize(32, 32)
-        refresh_btn.setToolTip("Rafraîchir la liste des périphériques")
-        refresh_btn.setCursor(Qt.PointingHandCursor)
-        device_layout.addWidget(refresh_btn)
-        
-        # Manual configuration
-        manual_type_combo = QComboBox()
-        manual_type_combo.addItems(["PCAN", "IXXAT"])
-        manual_type_combo.setMinimumHeight(32)
-        manual_type_combo.hide()
-        
-        manual_channel_edit = QLineEdit()
-        manual_channel_edit.setPlaceholderText("Ex: PCAN_USBBUS1 ou 0")
-        manual_channel_edit.hide()
-        
-        # Virtual options
-        virtual_type_combo = QComboBox()
-        virtual_type_combo.addItems(["Virtual CAN", "SocketCAN (can0)", "SocketCAN (vcan0)"])
-        virtual_type_combo.setMinimumHeight(32)
-        virtual_type_combo.hide()
-        
-        virtual_row_label = QLabel("Interface:")
-        
-        def populate_devices():
-            device_combo.clear()
-            detected_devices = self.detect_hardware_devices()
-            
-            if detected_devices:
-                device_combo.addItem("🔍 Périphériques détectés:", "header")
-                for dev_type, channel in detected_devices:
-                    device_combo.addItem(f"  {dev_type} - {channel}", (dev_type, channel))
-                device_combo.insertSeparator(device_combo.count())
-            else:
-                device_combo.addItem("⚠️ Aucun périphérique détecté", "no_device")
-                device_combo.insertSeparator(device_combo.count())
-            
-            device_combo.addItem("⚙️ Configuration manuelle", "manual")
-            device_combo.insertSeparator(device_combo.count())
-            device_combo.addItem("🖥️ SocketCAN / Virtual", "virtual")
-        
-        populate_devices()
-        refresh_btn.clicked.connect(populate_devices)
-        
-        form.addRow("Périphérique:", device_layout)
-        
-        # Manual type/channel rows
-        type_row_label = QLabel("Type:")
-        form.addRow(type_row_label, manual_type_combo)
-        type_row_label.hide()
-        
-        channel_row_label = QLabel("Canal:")
-        form.addRow(channel_row_label, manual_channel_edit)
-        channel_row_label.hide()
-        
-        # Virtual row
-        form.addRow(virtual_row_label, virtual_type_combo)
-        virtual_row_label.hide()
-        
-        selected_interface = {"type": None, "channel": None}
-        
-        def on_device_changed():
-            current_data = device_combo.currentData()
-            
-            manual_type_combo.hide()
-            manual_channel_edit.hide()
-            type_row_label.hide()
-            channel_row_label.hide()
-            virtual_type_combo.hide()
-            virtual_row_label.hide()
-            
-            if current_data == "header" or current_data == "no_device":
-                device_combo.setCurrentIndex(device_combo.currentIndex() + 1)
-                return
-            elif current_data == "manual":
-                manual_type_combo.show()
-                manual_channel_edit.show()
-                type_row_label.show()
-                channel_row_label.show()
-                selected_interface["type"] = manual_type_combo.currentText()
-                selected_interface["channel"] = None
-            elif current_data == "virtual":
-                virtual_type_combo.show()
-                virtual_row_label.show()
-                selected_interface["type"] = "Virtual"
-                selected_interface["channel"] = "virtual"
-            elif isinstance(current_data, tuple):
-                dev_type, channel = current_data
-                selected_interface["type"] = dev_type
-                selected_interface["channel"] = channel
-        
-        device_combo.currentIndexChanged.connect(on_device_changed)
-        manual_type_combo.currentTextChanged.connect(lambda: selected_interface.update({"type": manual_type_combo.currentText()}))
-        
-        def on_virtual_type_changed():
-            vtype = virtual_type_combo.currentText()
-            if vtype == "Virtual CAN":
-                selected_interface["type"] = "Virtual"
-                selected_interface["channel"] = "virtual"
-            elif "can0" in vtype:
-                selected_interface["type"] = "SocketCAN"
-                selected_interface["channel"] = "can0"
-            elif "vcan0" in vtype:
-                selected_interface["type"] = "SocketCAN"
-                selected_interface["channel"] = "vcan0"
-        
-        virtual_type_combo.currentTextChanged.connect(on_virtual_type_changed)
-        on_device_changed()
-        
-        # Bitrate
-        bitrate_spin = QSpinBox()
-        bitrate_spin.setMinimum(10000)
-        bitrate_spin.setMaximum(5000000)
-        bitrate_spin.setSingleStep(125000)
-        bitrate_spin.setValue(500000)
-        bitrate_spin.setSuffix(" bit/s")
-        bitrate_spin.setMinimumHeight(32)
-        form.addRow("Débit:", bitrate_spin)
-        
-        layout.addLayout(form)
-        
-        # Buttons
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        layout.addWidget(buttons)
+        if self._add_dialog is None:
+            self._add_dialog = _AddInterfaceDialog(self)
+        dialog = self._add_dialog
+        dialog.reset()
         
         if dialog.exec_() == QDialog.Accepted:
-            interface_name = name_edit.text() or f"Interface_{len(self.interfaces)+1}"
-            interface_type = selected_interface["type"]
+            interface_name = dialog.name_edit.text() or self._default_interface_name()
+            interface_type = dialog.selected_interface["type"]
             
-            if device_combo.currentData() == "manual":
-                channel = manual_channel_edit.text()
+            if dialog.device_combo.currentData() == "manual":
+                channel = dialog.manual_channel_edit.text()
                 if not channel:
                     QMessageBox.warning(dialog, "Erreur", "Veuillez saisir un canal")
                     return
             else:
-                channel = selected_interface["channel"]
+                channel = dialog.selected_interface["channel"]
             
             # Add to table
             config = {
                 'name': interface_name,
                 'type': interface_type,
                 'channel': channel,
-                'bitrate': bitrate_spin.value(),
+                'bitrate': dialog.bitrate_spin.value(),
                 'enabled': False,
-                'dbc_files': []  # List of DBC file paths
+                'dbc_files': [],  # List of {'path', 'name'} DBC entries
+                'dbc_set': set()  # Paths in dbc_files, for duplicate checks
             }
             
-            row = self.table.add_interface(config)
+            self.table.begin_bulk_insert()
+            try:
+                self.table.add_interface(config)
+            finally:
+                self.table.end_bulk_insert()
             self.interfaces[interface_name] = config
             self.interface_added.emit(interface_name, interface_type)
     
+    def _default_interface_name(self):
+        """First Interface_<n> name not used by another interface"""
+        number = len(self.interfaces) + 1
+        while f"Interface_{number}" in self.interfaces:
+            number += 1
+        return f"Interface_{number}"
+    
+    def load_interfaces(self, configs):
+        """Add a batch of interface configs (e.g. restored from a saved setup)"""
+        # Names are the interface ids: skip known names and repeats in the batch
+        seen = set(self.interfaces)
+        unique = []
+        for config in configs:
+            if config['name'] not in seen:
+                seen.add(config['name'])
+                unique.append(config)
+        configs = unique
+        for config in configs:
+            config.setdefault('enabled', False)
+            config.setdefault('dbc_files', [])
+        
+        self.table.add_interfaces(configs)
+        for config in configs:
+            self.interfaces[config['name']] = config
+            self.interface_added.emit(config['name'], config['type'])
+    
     def edit_interface(self, row):
         """Edit an interface"""
         if row >= len(self.table.interface_data):
@@ -587,24 +1035,19 @@ class InterfaceManagerPanel(QWidget):
         layout.addWidget(buttons)
         
         if dialog.exec_() == QDialog.Accepted:
-            # Update config
             old_name = config['name']
-            config['name'] = name_edit.text()
+            new_name = name_edit.text()
+            if new_name != old_name and new_name in self.interfaces:
+                QMessageBox.warning(self, "Erreur", f"Une interface nommée '{new_name}' existe déjà")
+                return
+            
+            # Update config
+            config['name'] = new_name
             config['channel'] = channel_edit.text()
             config['bitrate'] = bitrate_spin.value()
             
             # Update table
-            self.table.item(row, 1).setText(config['name'])
-            self.table.item(row, 3).setText(config['channel'])
-            
-            bitrate = config['bitrate']
-            if bitrate >= 1000000:
-                bitrate_text = f"{bitrate / 1000000:.1f} Mbit/s"
-            elif bitrate >= 1000:
-                bitrate_text = f"{bitrate / 1000:.0f} kbit/s"
-            else:
-                bitrate_text = f"{bitrate} bit/s"
-            self.table.item(row, 4).setText(bitrate_text)
+            self.table.refresh_interface(row, old_name)
             
             # Update interfaces dict
             if old_name in self.interfaces:
@@ -630,8 +1073,7 @@ class InterfaceManagerPanel(QWidget):
             self.interface_removed.emit(config['name'])
             
             # Remove from table
-            self.table.removeRow(row)
-            self.table.interface_data.pop(row)
+            self.table.remove_interface(row)
             
             # Remove from dict
             if config['name'] in self.interfaces:
@@ -663,16 +1105,19 @@ class InterfaceManagerPanel(QWidget):
         dbc_list.setAlternatingRowColors(True)
         dbc_list.setRootIsDecorated(False)
         
-        # Populate with existing DBCs
-        if 'dbc_files' not in config:
-            config['dbc_files'] = []
+        # Populate with existing DBCs (plain paths from older configs become entries)
+        config['dbc_files'] = [_dbc_entry(entry) if isinstance(entry, str) else entry
+                               for entry in config.get('dbc_files', [])]
+        if 'dbc_set' not in config:
+            config['dbc_set'] = {entry['path'] for entry in config['dbc_files']}
         
-        for dbc_path in config['dbc_files']:
-            import os
-            filename = os.path.basename(dbc_path)
-            item = QTreeWidgetItem([filename, dbc_path])
-            dbc_list.addTopLevelItem(item)
+        items = [QTreeWidgetItem([entry['name'], entry['path']]) for entry in config['dbc_files']]
+        if items:
+            dbc_list.setUpdatesEnabled(False)
+            dbc_list.addTopLevelItems(items)
+            dbc_list.setUpdatesEnabled(True)
         
+        # Resize modes set once the list is filled, contents measured a single time
         dbc_list.header().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         dbc_list.header().setSectionResizeMode(1, QHeaderView.Stretch)
         
@@ -682,19 +1127,7 @@ class InterfaceManagerPanel(QWidget):
         button_layout = QHBoxLayout()
         
         add_btn = QPushButton("+ Ajouter DBC")
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #238636;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #2ea043;
-            }
-        """)
+        add_btn.setStyleSheet(_BTN_GREEN_CSS)
         
         def add_dbc():
             file_path, _ = QFileDialog.getOpenFileName(
@@ -705,19 +1138,18 @@ class InterfaceManagerPanel(QWidget):
             )
             
             if file_path:
-                import os
-                filename = os.path.basename(file_path)
-                
                 # Check if already added
-                if file_path in config['dbc_files']:
+                if file_path in config['dbc_set']:
                     QMessageBox.warning(dialog, "DBC déjà ajouté", "Cette base de données est déjà dans la liste.")
                     return
                 
                 # Add to config
-                config['dbc_files'].append(file_path)
+                entry = _dbc_entry(file_path)
+                config['dbc_set'].add(file_path)
+                config['dbc_files'].append(entry)
                 
                 # Add to list
-                item = QTreeWidgetItem([filename, file_path])
+                item = QTreeWidgetItem([entry['name'], file_path])
                 dbc_list.addTopLevelItem(item)
                 
                 # Emit signal for first DBC or if interface is connected
@@ -728,19 +1160,7 @@ class InterfaceManagerPanel(QWidget):
         button_layout.addWidget(add_btn)
         
         remove_btn = QPushButton("− Supprimer")
-        remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #da3633;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #e5534b;
-            }
-        """)
+        remove_btn.setStyleSheet(_BTN_RED_CSS)
         
         def remove_dbc():
             current_item = dbc_list.currentItem()
@@ -759,8 +1179,9 @@ class InterfaceManagerPanel(QWidget):
             
             if reply == QMessageBox.Yes:
                 # Remove from config
-                if file_path in config['dbc_files']:
-                    config['dbc_files'].remove(file_path)
+                config['dbc_set'].discard(file_path)
+                config['dbc_files'] = [entry for entry in config['dbc_files']
+                                       if entry['path'] != file_path]
                 
                 # Remove from list
                 index = dbc_list.indexOfTopLevelItem(current_item)
@@ -781,19 +1202,30 @@ class InterfaceManagerPanel(QWidget):
     
     def set_interface_connected(self, interface_id, connected):
         """Update interface connection state"""
-        for row, config in enumerate(self.table.interface_data):
-            if config['name'] == interface_id:
-                self.table.update_status(row, connected)
-                break
+        row = self.table.row_of(interface_id)
+        if row is not None:
+            self.table.update_status(row, connected)
     
     def update_interface_bus_load(self, interface_id, load_percent):
-        """Update interface bus load"""
-        for row, config in enumerate(self.table.interface_data):
-            if config['name'] == interface_id:
-                self.table.update_bus_load(row, load_percent)
-                break
+        """Update interface bus load (applied on the next flush)"""
+        self._pending_bus_load[interface_id] = load_percent
     
     def update_interface_statistics(self, interface_id, message_count, error_count):
-        """Update interface statistics"""
-        # Could add columns for message/error count if needed
-        pass
+        """Update interface statistics (applied on the next flush)"""
+        self._pending_statistics[interface_id] = (message_count, error_count)
+    
+    def _flush_updates(self):
+        """Apply the latest buffered bus load and statistics of each interface"""
+        if self._pending_bus_load:
+            pending, self._pending_bus_load = self._pending_bus_load, {}
+            for interface_id, load_percent in pending.items():
+                row = self.table.row_of(interface_id)
+                if row is not None:
+                    self.table.update_bus_load(row, load_percent)
+        
+        if self._pending_statistics:
+            pending, self._pending_statistics = self._pending_statistics, {}
+            for interface_id, (message_count, error_count) in pending.items():
+                row = self.table.row_of(interface_id)
+                if row is not None:
+                    self.table.update_statistics(row, message_count, error_count)
@@ -8,11 +8,14 @@ from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QStatusBar, QDockWidget, QAction,
                              QMenuBar, QFileDialog, QMessageBox, QTabWidget,
                              QLabel, QSplitter)
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import (Qt, QTimer, QObject, QThread, QMetaObject,
+                          pyqtSignal, pyqtSlot)
 from PyQt5.QtGui import QIcon
-import can
+from typing import TYPE_CHECKING
 import time
 import logging
+import numpy as np
+from collections import deque, OrderedDict
 
 from src.can_interface.can_manager import CANInterfaceManager
 from src.parsers.database_parser import DatabaseParser
@@ -29,12 +32,347 @@ from src.gui.configuration_panel import ConfigurationPanel
 from src.gui.bus_load_analyzer import BusLoadAnalyzer
 from src.gui.styles import get_theme
 
+if TYPE_CHECKING:
+    import can  # Only used in annotations
+
 logger = logging.getLogger(__name__)
 
+# Fallback clock for frames without a driver timestamp. It must stay wall-clock
+# (not perf_counter) to line up with python-can timestamps and CSV recordings.
+_now = time.time
+
+
+def _ignore_frame(msg, timestamp):
+    """Frame handler for ids nothing is interested in."""
+
+
+class CanWorker(QObject):
+    """Processes received CAN frames off the GUI thread.
+    
+    Frames are pushed into a bounded ring buffer from the CAN notifier
+    thread and drained in batches on the worker thread, which decodes,
+    records and evaluates triggers. The latest value of each selected
+    signal lives in a fixed-size array indexed by a small integer id;
+    the GUI only receives periodic snapshots of the values that changed.
+    """
+    
+    # Signals
+    signals_updated = pyqtSignal(dict)  # latest value per changed signal
+    message_count_changed = pyqtSignal(int)  # received frames so far
+    
+    RING_SIZE = 65536  # Frames buffered before the oldest are dropped
+    DRAIN_INTERVAL_MS = 10
+    SNAPSHOT_INTERVAL = 0.05  # Seconds, aligned with the plot timer
+    DECODE_CACHE_SIZE = 4096  # Distinct (id, payload) pairs kept decoded
+    CLOCK_TOLERANCE = 60.0  # Seconds; frame timestamps further from wall-clock are relative
+    
+    def __init__(self, db_parser: DatabaseParser, signal_processor: SignalProcessor,
+                 recorder: DataRecorder, trigger_manager: TriggerManager):
+        super().__init__()
+        self.db_parser = db_parser
+        self.signal_processor = signal_processor
+        self.recorder = recorder
+        self.trigger_manager = trigger_manager
+        
+        # Worker-owned state
+        self.message_count = 0
+        self._rx_ring = deque(maxlen=self.RING_SIZE)
+        self._tx_ring = deque(maxlen=self.RING_SIZE)
+        self._changed = False
+        self._last_snapshot = 0.0
+        self._drain_timer = None
+        self._msg_name_by_id = {}
+        self._signal_keys = {}  # '<ID>_<signal>' -> (arbitration_id, signal_name)
+        self._decode_cache = OrderedDict()
+        self._clock_offset = None  # Added to msg.timestamp to get wall-clock time
+        self._dispatch = {}  # arbitration_id -> frame handler
+        self._record_mode = None  # 'raw'/'decoded' while recording, else None
+        self._db_loaded = False
+        self._idle = True  # No frame needs more than counting
+        self.set_signals([])
+    
+    @pyqtSlot(list)
+    def set_signals(self, selected_signals: list):
+        """Assign an integer id to each selected signal and reset the value array."""
+        self.selected_signals = list(selected_signals)
+        self._signal_index = {name: idx for idx, name in enumerate(self.selected_signals)}
+        
+        # arbitration_id -> {signal_name: id}, so the hot path never formats a key
+        # and skips messages without any selected signal
+        self._slots_by_id = {}
+        for name, idx in self._signal_index.items():
+            key = self._signal_keys.get(name)
+            if key is None:
+                msg_id, _, signal_name = name.partition('_')
+                key = (int(msg_id, 16), signal_name)
+            msg_id, signal_name = key
+            self._slots_by_id.setdefault(msg_id, {})[signal_name] = idx
+        
+        self._latest = np.full(len(self.selected_signals), np.nan)
+        self._dirty_mask = np.zeros(len(self.selected_signals), dtype=bool)
+        self.trigger_manager.set_signal_index(self._signal_index)
+        self._dispatch.clear()
+        self._update_idle()
+    
+    @pyqtSlot()
+    def load_message_names(self):
+        """Cache message and signal names from the database."""
+        messages = self.db_parser.get_messages()
+        self._msg_name_by_id = {msg['id']: msg['name'] for msg in messages}
+        self._signal_keys = {f"{msg['id']:X}_{signal_name}": (msg['id'], signal_name)
+                             for msg in messages for signal_name in msg['signals']}
+        self._decode_cache.clear()
+        self.refresh_configuration()
+    
+    @pyqtSlot()
+    def refresh_configuration(self):
+        """Re-read the recording and database state and drop the frame handlers.
+        
+        Called when recording starts or stops and when the database changes,
+        so the per-frame path never polls these.
+        """
+        recorder = self.recorder
+        self._record_mode = recorder.recording_mode if recorder.is_recording else None
+        self._db_loaded = self.db_parser.is_loaded()
+        self._dispatch.clear()
+        self._update_idle()
+    
+    def _update_idle(self):
+        """Idle when nothing is recorded raw and no frame needs decoding."""
+        mode = self._record_mode
+        self._idle = mode != 'raw' and not (
+            self._db_loaded and (self._slots_by_id or mode == 'decoded'))
+    
+    def _decode(self, msg_id: int, data) -> dict:
+        """Decode a payload, reusing the result for repeated (id, payload) pairs."""
+        key = (msg_id, bytes(data))
+        cache = self._decode_cache
+        try:
+            decoded = cache[key]
+        except KeyError:
+            decoded = self.db_parser.decode_message(msg_id, key[1])
+            cache[key] = decoded
+            if len(cache) > self.DECODE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return decoded
+    
+    @pyqtSlot(bool, str)
+    def on_connection_status_changed(self, connected: bool, message: str):
+        """Re-detect the timestamp clock of a newly connected interface."""
+        if connected:
+            self._clock_offset = None
+    
+    def _resolve_clock_offset(self, timestamp: float) -> float:
+        """Offset mapping a backend's frame timestamps to wall-clock time."""
+        now = time.time()
+        if abs(now - timestamp) < self.CLOCK_TOLERANCE:
+            return 0.0
+        logger.info("Interface timestamps are relative, offset %.3fs", now - timestamp)
+        return now - timestamp
+    
+    def enqueue(self, msg: "can.Message"):
+        """Queue a received frame (called from the CAN notifier thread)."""
+        self._rx_ring.append(msg)
+    
+    def enqueue_sent(self, msg: "can.Message"):
+        """Queue a sent frame for plotting."""
+        self._tx_ring.append(msg)
+    
+    @pyqtSlot()
+    def start(self):
+        """Start draining the ring buffers (runs in the worker thread)."""
+        self._drain_timer = QTimer(self)
+        self._drain_timer.timeout.connect(self._drain)
+        self._drain_timer.start(self.DRAIN_INTERVAL_MS)
+    
+    @pyqtSlot()
+    def stop(self):
+        """Stop draining and process what is left in the buffers."""
+        if self._drain_timer is not None:
+            self._drain_timer.stop()
+        self._drain()
+    
+    def _drain(self):
+        """Process all queued frames and publish a snapshot if due."""
+        ring = self._tx_ring
+        if ring:
+            batch = [ring.popleft() for _ in range(len(ring))]
+            self.process_sent_batch(batch)
+        
+        ring = self._rx_ring
+        if ring:
+            batch = [ring.popleft() for _ in range(len(ring))]
+            self.process_batch(batch)
+        
+        now = time.monotonic()
+        if self._changed and now - self._last_snapshot >= self.SNAPSHOT_INTERVAL:
+            self._changed = False
+            self._last_snapshot = now
+            dirty = self._dirty_mask
+            if dirty.any():
+                names = self.selected_signals
+                latest = self._latest
+                self.signals_updated.emit({names[idx]: float(latest[idx])
+                                           for idx in np.flatnonzero(dirty)})
+                dirty[:] = False
+            self.message_count_changed.emit(self.message_count)
+    
+    def _build_handler(self, arb_id: int, record_raw: bool, record_decoded: bool,
+                       loaded: bool):
+        """Build the frame handler for one arbitration id and the current configuration.
+        
+        Only the steps enabled for this id are kept, so the per-frame
+        branches on recording mode, database and selection are resolved once.
+        Handlers return the bitmask of the signal ids they updated, if any.
+        """
+        recorder = self.recorder
+        slots = self._slots_by_id.get(arb_id)
+        
+        if not (loaded and (slots or record_decoded)):
+            # Nothing to decode for this id
+            if record_raw:
+                return recorder.record_raw_message
+            return _ignore_frame
+        
+        names = self.selected_signals
+        
+        # Recording column of each selected signal, for the decoded CSV row
+        columns = {name: col for col, name in enumerate(recorder.selected_signals)}
+        n_columns = len(columns)
+        slot_items = tuple((signal_name, idx, 1 << idx, columns.get(names[idx]))
+                           for signal_name, idx in slots.items()) if slots else ()
+        msg_name = self._msg_name_by_id.get(arb_id) or f"0x{arb_id:X}"
+        decode = self._decode
+        add_sample = self.signal_processor.add_sample
+        latest = self._latest
+        dirty = self._dirty_mask
+        
+        def handle(msg, timestamp):
+            if record_raw:
+                recorder.record_raw_message(msg, timestamp)
+            
+            decoded = decode(arb_id, msg.data)
+            if not decoded:
+                return 0
+            
+            # Update the selected signals of this message, filling the
+            # decoded recording row in the same pass
+            row = [''] * n_columns if record_decoded else None
+            updated = 0  # Bitmask of the signal ids present in this frame
+            for signal_name, idx, bit, col in slot_items:
+                value = decoded.get(signal_name)
+                if value is None:
+                    continue
+                physical = value['physical']
+                latest[idx] = physical
+                dirty[idx] = True
+                updated |= bit
+                if row is not None and col is not None:
+                    row[col] = physical
+                
+                # Add to signal processor for analysis
+                add_sample(names[idx], physical, timestamp)
+            
+            # Record decoded message if in decoded mode
+            if row is not None:
+                recorder.record_decoded_row(timestamp, arb_id, msg_name, row)
+            
+            return updated
+        
+        return handle
+    
+    @pyqtSlot(list)
+    def process_batch(self, batch: list):
+        """Decode, record and evaluate triggers for a batch of received frames."""
+        self.message_count += len(batch)
+        self._changed = True
+        if self._idle:
+            # Only counting, e.g. observing the bus before a database is loaded
+            return
+        
+        dispatch = self._dispatch
+        mode = self._record_mode
+        loaded = self._db_loaded
+        offset = self._clock_offset
+        updated = 0  # Signal ids updated anywhere in the batch
+        
+        for msg in batch:
+            arb_id = msg.arbitration_id
+            handler = dispatch.get(arb_id)
+            if handler is None:
+                handler = dispatch[arb_id] = self._build_handler(
+                    arb_id, mode == 'raw', mode == 'decoded', loaded)
+            if handler is _ignore_frame:
+                continue
+            
+            # Use the driver timestamp, mapped to wall-clock once per connection
+            timestamp = msg.timestamp
+            if not timestamp:
+                timestamp = _now()
+            else:
+                if offset is None:
+                    offset = self._clock_offset = self._resolve_clock_offset(timestamp)
+                timestamp += offset
+            
+            updated |= handler(msg, timestamp) or 0
+        
+        # Evaluate the triggers once per batch, on the latest values, and
+        # only those that depend on a signal updated in it
+        trigger_manager = self.trigger_manager
+        if updated and trigger_manager.armed_count and trigger_manager.signal_mask & updated:
+            trigger_manager.evaluate_all(self._latest, updated)
+    
+    def process_sent_batch(self, batch: list):
+        """Decode sent frames so they show up on the plot."""
+        if not self._db_loaded:
+            return
+        
+        slots_by_id = self._slots_by_id
+        names = self.selected_signals
+        latest = self._latest
+        dirty = self._dirty_mask
+        add_sample = self.signal_processor.add_sample
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+        
+        for msg in batch:
+            slots = slots_by_id.get(msg.arbitration_id)
+            if not slots:
+                continue
+            
+            timestamp = msg.timestamp or _now()
+            decoded = self._decode(msg.arbitration_id, msg.data)
+            
+            if decoded:
+                # Update the selected signals with sent data
+                for signal_name, idx in slots.items():
+                    value = decoded.get(signal_name)
+                    if value is None:
+                        continue
+                    physical = value['physical']
+                    latest[idx] = physical
+                    dirty[idx] = True
+                    self._changed = True
+                    
+                    # Add to signal processor for plotting
+                    add_sample(names[idx], physical, timestamp)
+                    if log_debug:
+                        logger.debug("Plotted sent signal: %s = %s", names[idx], physical)
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
     
+    # Plot refresh interval bounds (ms), adapted to the received frame rate
+    MIN_UPDATE_INTERVAL = 33
+    MAX_UPDATE_INTERVAL = 500
+    IDLE_UPDATE_INTERVAL = 200  # Lower bound while no plotted signal changes
+    
+    # Signals
+    signals_selected = pyqtSignal(list)  # forwarded to the CAN worker
+    database_changed = pyqtSignal()  # worker drops its decode cache and message names
+    
     def __init__(self):
         super().__init__()
         
@@ -47,25 +385,43 @@ class MainWindow(QMainWindow):
         
         # State
         self.selected_signals = []
-        self.signal_values = {}
+        self.dirty_signals = set()  # Signals with new samples since the last plot update
+        self._last_seen = {}  # Sample index already plotted, per signal
         self.message_count = 0
+        self._frame_rate = 0.0  # Smoothed received frames per second
+        self._rate_count = 0
+        self._rate_time = time.monotonic()
         self.sent_message_count = 0
+        self._rx_shown = 0  # Counts currently displayed in the status bar
+        self._tx_shown = 0
         self.current_theme = 'dark'
         self.plot_sent_messages = True  # Option to plot sent messages
+        self._pending_status = None  # (message, timeout) shown on the next flush
         
         # Apply modern theme
         self.setStyleSheet(get_theme(self.current_theme))
         
+        # Frame processing runs on its own thread
+        self.can_worker = CanWorker(self.db_parser, self.signal_processor,
+                                    self.recorder, self.trigger_manager)
+        self.worker_thread = QThread(self)
+        self.can_worker.moveToThread(self.worker_thread)
+        self.worker_thread.started.connect(self.can_worker.start)
+        self.signals_selected.connect(self.can_worker.set_signals, Qt.QueuedConnection)
+        self.database_changed.connect(self.can_worker.load_message_names, Qt.QueuedConnection)
+        
         # Setup UI
         self.init_ui()
         self.create_menu_bar()
         self.create_dock_widgets()
         self.connect_signals()
         
-        # Setup update timer for real-time plotting
+        self.worker_thread.start()
+        
+        # Setup update timer for real-time plotting (runs only while connected)
         self.update_timer = QTimer()
+        self.update_timer.setInterval(50)  # 20 Hz until the frame rate is known
         self.update_timer.timeout.connect(self.update_plots)
-        self.update_timer.start(50)  # 20 Hz update rate
         
         self.setWindowTitle("CAN Real-Time Plotter - Modern Edition")
         self.resize(1600, 1000)
@@ -173,14 +529,24 @@ class MainWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         
-        # Message counter with icons
-        self.msg_counter_label = QLabel("📥 RX: 0 | 📤 TX: 0")
-        self.msg_counter_label.setStyleSheet("padding: 4px 12px; font-weight: bold;")
-        self.status_bar.addWidget(self.msg_counter_label)
+        # Message counters with icons; only the numbers change at run time
+        counter_widget = QWidget()
+        counter_widget.setObjectName("msgCounter")
+        counter_layout = QHBoxLayout(counter_widget)
+        counter_layout.setContentsMargins(0, 0, 0, 0)
+        counter_layout.setSpacing(0)
+        self.rx_num_label = QLabel("0")
+        self.tx_num_label = QLabel("0")
+        counter_layout.addWidget(QLabel("📥 RX:"))
+        counter_layout.addWidget(self.rx_num_label)
+        counter_layout.addWidget(QLabel("|"))
+        counter_layout.addWidget(QLabel("📤 TX:"))
+        counter_layout.addWidget(self.tx_num_label)
+        self.status_bar.addWidget(counter_widget)
         
         # Connection status with icon
         self.status_label = QLabel("⚫ Not connected")
-        self.status_label.setStyleSheet("padding: 4px 12px;")
+        self.status_label.setObjectName("statusLabel")  # Colored by its "state" property
         self.status_bar.addPermanentWidget(self.status_label)
         
     def create_menu_bar(self):
@@ -201,7 +567,7 @@ class MainWindow(QMainWindow):
         file_menu.addAction(exit_action)
         
         # View menu
-        view_menu = menubar.addMenu("View")
+        menubar.addMenu("View")
         
         # Options menu
         options_menu = menubar.addMenu("Options")
@@ -236,25 +602,42 @@ class MainWindow(QMainWindow):
         
     def connect_signals(self):
         """Connect signals and slots."""
-        # CAN manager signals
-        self.can_manager.message_received.connect(self.on_message_received)
-        self.can_manager.message_sent.connect(self.on_message_sent)
-        self.can_manager.connection_status_changed.connect(self.on_connection_status_changed)
-        self.can_manager.error_occurred.connect(self.on_error)
+        # Received frames go straight from the notifier thread into the worker's ring buffer
+        self.can_manager.add_rx_listener(self.can_worker.enqueue)
+        
+        # Connection types are explicit: direct between GUI-thread objects,
+        # queued to and from the worker thread
+        
+        # CAN manager signals (emitted from the GUI thread)
+        self.can_manager.message_sent.connect(self.on_message_sent, Qt.DirectConnection)
+        self.can_manager.connection_status_changed.connect(self.on_connection_status_changed,
+                                                           Qt.DirectConnection)
+        self.can_manager.connection_status_changed.connect(self.can_worker.on_connection_status_changed,
+                                                           Qt.QueuedConnection)
+        self.can_manager.error_occurred.connect(self.on_error, Qt.DirectConnection)
         
         # Connect bus analyzer to receive messages
-        self.can_manager.message_received.connect(self.bus_analyzer.record_message)
+        self.can_manager.add_rx_listener(self.bus_analyzer.record_message)
         
         # Configuration panel signals
-        self.config_panel.dbc_loaded.connect(self.on_dbc_loaded)
-        self.config_panel.dbc_removed.connect(self.on_dbc_removed)
+        self.config_panel.dbc_loaded.connect(self.on_dbc_loaded, Qt.DirectConnection)
+        self.config_panel.dbc_removed.connect(self.on_dbc_removed, Qt.DirectConnection)
         
         # Recorder signals
-        self.recorder.recording_started.connect(self.on_recording_started)
-        self.recorder.recording_stopped.connect(self.on_recording_stopped)
+        self.recorder.recording_started.connect(self.on_recording_started, Qt.DirectConnection)
+        self.recorder.recording_stopped.connect(self.on_recording_stopped, Qt.DirectConnection)
+        self.recorder.recording_started.connect(self.can_worker.refresh_configuration,
+                                                Qt.QueuedConnection)
+        self.recorder.recording_stopped.connect(self.can_worker.refresh_configuration,
+                                                Qt.QueuedConnection)
+        
+        # Trigger signals (triggers are evaluated on the worker thread)
+        self.trigger_manager.trigger_fired.connect(self.on_trigger_fired, Qt.QueuedConnection)
         
-        # Trigger signals
-        self.trigger_manager.trigger_fired.connect(self.on_trigger_fired)
+        # Worker snapshots
+        self.can_worker.signals_updated.connect(self.on_signals_updated, Qt.QueuedConnection)
+        self.can_worker.message_count_changed.connect(self.on_message_count_changed,
+                                                      Qt.QueuedConnection)
         
     def show_connection_dialog(self):
         """Show the connection configuration dialog."""
@@ -289,6 +672,7 @@ class MainWindow(QMainWindow):
         
         if file_path:
             if self.db_parser.load_database(file_path):
+                self.database_changed.emit()
                 QMessageBox.information(
                     self,
                     "Success",
@@ -317,13 +701,15 @@ class MainWindow(QMainWindow):
     
     def on_dbc_loaded(self, file_path: str):
         """Handle DBC file loaded from configuration panel."""
+        self.database_changed.emit()
         self.select_signals_btn.setEnabled(True)
         self.message_sender.update_database()
-        logger.info(f"DBC loaded: {file_path}")
+        logger.info("DBC loaded: %s", file_path)
     
     def on_dbc_removed(self, file_path: str):
         """Handle DBC file removed from configuration panel."""
-        logger.info(f"DBC removed: {file_path}")
+        self.database_changed.emit()
+        logger.info("DBC removed: %s", file_path)
     
     def show_signal_selector(self):
         """Show signal selection dialog."""
@@ -334,10 +720,13 @@ class MainWindow(QMainWindow):
         dialog = SignalSelector(self.db_parser, self)
         if dialog.exec_():
             self.selected_signals = dialog.get_selected_signals()
+            self.signals_selected.emit(self.selected_signals)
+            self._last_seen = {}
+            self.dirty_signals = set(self.selected_signals)
             self.plot_widget.set_signals(self.selected_signals)
             self.statistics_panel.set_signals(self.selected_signals)
             self.trigger_config.set_available_signals(self.selected_signals)
-            logger.info(f"Selected {len(self.selected_signals)} signals for plotting")
+            logger.info("Selected %d signals for plotting", len(self.selected_signals))
     
     def toggle_theme(self):
         """Toggle between dark and light themes."""
@@ -349,14 +738,14 @@ class MainWindow(QMainWindow):
         self.plot_sent_messages = self.plot_sent_action.isChecked()
         self.plot_sent_checkbox.setChecked(self.plot_sent_messages)
         status = "enabled" if self.plot_sent_messages else "disabled"
-        self.status_bar.showMessage(f"Plot sent messages {status}", 3000)
+        self.show_status(f"Plot sent messages {status}", 3000)
     
     def on_plot_sent_checkbox_toggled(self, checked: bool):
         """Handle plot sent messages checkbox toggle."""
         self.plot_sent_messages = checked
         self.plot_sent_action.setChecked(checked)
         status = "enabled" if checked else "disabled"
-        self.status_bar.showMessage(f"Plot sent messages {status}", 3000)
+        self.show_status(f"Plot sent messages {status}", 3000)
     
     def toggle_recording(self):
         """Toggle data recording on/off."""
@@ -370,99 +759,136 @@ class MainWindow(QMainWindow):
             self.recorder.stop_recording()
             self.record_btn.setText("⏺ Start Recording")
     
-    def on_message_sent(self, msg: can.Message):
+    def on_message_sent(self, msg: "can.Message"):
         """Handle sent CAN message."""
         self.sent_message_count += 1
-        self.msg_counter_label.setText(f"📥 RX: {self.message_count} | 📤 TX: {self.sent_message_count}")
-        logger.info(f"Sent: ID=0x{msg.arbitration_id:03X}, Data={msg.data.hex().upper()}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sent: ID=0x%03X, Data=%s", msg.arbitration_id, msg.data.hex().upper())
         
         # Process sent message for plotting if enabled
-        if self.plot_sent_messages and self.db_parser.is_loaded():
-            timestamp = time.time()
-            decoded = self.db_parser.decode_message(msg.arbitration_id, msg.data)
-            
-            if decoded:
-                # Update signal values with sent data
-                for signal_name, value in decoded.items():
-                    full_signal_name = f"{msg.arbitration_id:X}_{signal_name}"
-                    self.signal_values[full_signal_name] = value
-                    
-                    # Add to signal processor for plotting
-                    if full_signal_name in self.selected_signals:
-                        self.signal_processor.add_sample(full_signal_name, value, timestamp)
-                        logger.debug(f"Plotted sent signal: {full_signal_name} = {value}")
+        if self.plot_sent_messages:
+            self.can_worker.enqueue_sent(msg)
     
-    def on_message_received(self, msg: can.Message):
-        """Handle received CAN message."""
-        timestamp = time.time()
-        
-        # Update message counter
-        self.message_count += 1
-        self.msg_counter_label.setText(f"📥 RX: {self.message_count} | 📤 TX: {self.sent_message_count}")
-        
-        # Record raw message if in raw mode
-        if self.recorder.is_recording and self.recorder.recording_mode == 'raw':
-            self.recorder.record_raw_message(msg, timestamp)
-        
-        # Decode message if database loaded
-        if self.db_parser.is_loaded():
-            decoded = self.db_parser.decode_message(msg.arbitration_id, msg.data)
-            
-            if decoded:
-                # Update signal values
-                for signal_name, value in decoded.items():
-                    full_signal_name = f"{msg.arbitration_id:X}_{signal_name}"
-                    self.signal_values[full_signal_name] = value
-                    
-                    # Add to signal processor for analysis
-                    if full_signal_name in self.selected_signals:
-                        self.signal_processor.add_sample(full_signal_name, value, timestamp)
-                
-                # Record decoded message if in decoded mode
-                if self.recorder.is_recording and self.recorder.recording_mode == 'decoded':
-                    message = self.db_parser.get_message_by_id(msg.arbitration_id)
-                    msg_name = message.name if message else f"0x{msg.arbitration_id:X}"
-                    self.recorder.record_decoded_message(timestamp, msg.arbitration_id, 
-                                                        msg_name, decoded)
-                
-                # Evaluate triggers
-                self.trigger_manager.evaluate_all(self.signal_values)
+    def on_signals_updated(self, signal_values: dict):
+        """Mark the signals of a worker snapshot for the next plot update."""
+        self.dirty_signals.update(signal_values)
+    
+    def on_message_count_changed(self, count: int):
+        """Update the RX counter from the worker."""
+        self.message_count = count
     
     def update_plots(self):
-        """Update plots with latest data."""
-        for signal_name in self.selected_signals:
-            times, values = self.signal_processor.get_data(signal_name)
+        """Append the samples received since the last update to the plots."""
+        # Refresh faster when frames arrive faster, slow down on an idle bus
+        # or while the frames do not touch any plotted signal
+        now = time.monotonic()
+        elapsed = now - self._rate_time
+        if elapsed > 0:
+            rate = (self.message_count - self._rate_count) / elapsed
+            self._frame_rate = 0.8 * self._frame_rate + 0.2 * rate
+            self._rate_count = self.message_count
+            self._rate_time = now
+            interval = max(self.MIN_UPDATE_INTERVAL,
+                           min(self.MAX_UPDATE_INTERVAL, int(1000 / (self._frame_rate + 1))))
+            if not self.dirty_signals:
+                interval = max(interval, self.IDLE_UPDATE_INTERVAL)
+            if interval != self.update_timer.interval():
+                self.update_timer.setInterval(interval)
+        
+        if self.message_count != self._rx_shown:
+            self._rx_shown = self.message_count
+            self.rx_num_label.setNum(self._rx_shown)
+        if self.sent_message_count != self._tx_shown:
+            self._tx_shown = self.sent_message_count
+            self.tx_num_label.setNum(self._tx_shown)
+        
+        # Slower panels refresh on their own cadence from this single timer
+        self.bus_analyzer.tick(now)
+        self._flush_status()
+        
+        dirty = self.dirty_signals
+        if not dirty:
+            return
+        self.dirty_signals = set()
+        
+        # Snapshots sent before a new selection reached the worker may name
+        # signals that are no longer plotted
+        dirty.intersection_update(self.plot_widget.curves)
+        
+        # Collect the new tails, then hand them to the plot in one call
+        last_seen = self._last_seen
+        get_data_since = self.signal_processor.get_data_since
+        names, times_list, values_list = [], [], []
+        for signal_name in dirty:
+            times, values, last_seen[signal_name] = get_data_since(
+                signal_name, last_seen.get(signal_name, 0))
             if len(times) > 0:
-                self.plot_widget.update_plot(signal_name, times, values)
+                names.append(signal_name)
+                times_list.append(times)
+                values_list.append(values)
+        
+        if names:
+            self.plot_widget.append_plots(names, times_list, values_list)
         
         # Update statistics
-        self.statistics_panel.update_statistics(self.signal_processor)
+        self.statistics_panel.update_statistics(self.signal_processor, dirty)
     
     def on_connection_status_changed(self, connected: bool, message: str):
         """Handle connection status changes."""
         if connected:
+            self.update_timer.setTimerType(Qt.PreciseTimer)
+            self.update_timer.start()
             self.status_label.setText(f"🟢 {message}")
-            self.status_label.setStyleSheet("color: #4caf50; padding: 4px 12px; font-weight: bold;")
         else:
+            self.update_timer.stop()
+            self.update_plots()  # Draw what arrived before the disconnect
+            self.bus_analyzer.update_statistics()
             self.status_label.setText(f"⚫ {message}")
-            self.status_label.setStyleSheet("color: #f44336; padding: 4px 12px;")
+        self._set_label_state(self.status_label, "connected" if connected else "disconnected")
+    
+    @staticmethod
+    def _set_label_state(label: QLabel, state: str):
+        """Restyle a label through its "state" property and the theme selectors."""
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
+    
+    def show_status(self, message: str, timeout: int = 0):
+        """Show a status bar message, keeping only the latest one per update.
+        
+        Messages are flushed by update_plots while it runs, otherwise on the
+        next pass of the event loop.
+        """
+        if self._pending_status is None and not self.update_timer.isActive():
+            QTimer.singleShot(0, self._flush_status)
+        self._pending_status = (message, timeout)
+    
+    def _flush_status(self):
+        """Display the pending status bar message, if any."""
+        if self._pending_status is not None:
+            message, timeout = self._pending_status
+            self._pending_status = None
+            self.status_bar.showMessage(message, timeout)
     
     def on_recording_started(self, file_path: str):
         """Handle recording started."""
-        self.status_bar.showMessage(f"Recording to: {file_path}", 5000)
+        self.show_status(f"Recording to: {file_path}", 5000)
     
     def on_recording_stopped(self, message_count: int):
         """Handle recording stopped."""
-        self.status_bar.showMessage(f"Recording stopped. Saved {message_count} messages", 5000)
+        self.show_status(f"Recording stopped. Saved {message_count} messages", 5000)
     
     def on_trigger_fired(self, trigger_name: str, signal_values: dict):
         """Handle trigger fired event."""
-        logger.info(f"Trigger fired: {trigger_name}")
-        self.status_bar.showMessage(f"Trigger '{trigger_name}' fired!", 3000)
+        logger.info("Trigger fired: %s", trigger_name)
+        self.show_status(f"Trigger '{trigger_name}' fired!", 3000)
     
     def on_error(self, error_msg: str):
         """Handle error messages."""
-        self.status_bar.showMessage(f"Error: {error_msg}", 5000)
+        self.show_status(f"Error: {error_msg}", 5000)
         logger.error(error_msg)
     
     def clear_all_data(self):
@@ -477,7 +903,7 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             self.signal_processor.clear_all()
             self.plot_widget.clear_all()
-            self.status_bar.showMessage("Data cleared", 3000)
+            self.show_status("Data cleared", 3000)
     
     def show_about(self):
         """Show about dialog."""
@@ -500,6 +926,13 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle application close."""
+        self.update_timer.stop()
+        
+        # Flush the worker before closing the recording
+        QMetaObject.invokeMethod(self.can_worker, "stop", Qt.BlockingQueuedConnection)
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        
         # Stop recording if active
         if self.recorder.is_recording:
             self.recorder.stop_recording()
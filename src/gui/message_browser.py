@@ -3,61 +3,283 @@ Message Browser - Navigation dans les messages CAN par trame
 Affichage hiérarchique des messages et signaux avec support des énumérations
 """
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTreeWidget, 
-                             QTreeWidgetItem, QLabel, QLineEdit, QPushButton,
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTreeView,
+                             QLabel, QLineEdit, QPushButton,
                              QSplitter, QTextEdit, QTableWidget, QTableWidgetItem,
-                             QHeaderView, QFrame, QComboBox)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+                             QHeaderView, QFrame, QComboBox, QStyledItemDelegate,
+                             QStyleOptionViewItem, QStyle, QApplication)
+from PyQt5.QtCore import (Qt, pyqtSignal, QTimer, QAbstractItemModel, QModelIndex,
+                          QSortFilterProxyModel)
 from PyQt5.QtGui import QFont, QColor
 
 
-class SignalValueWidget(QWidget):
-    """Widget pour afficher la valeur d'un signal avec son énumération"""
+class SignalValueDelegate(QStyledItemDelegate):
+    """Dessine la valeur d'un signal et son énumération, sans widget enfant
     
-    def __init__(self, signal_name, parent=None):
-        super().__init__(parent)
-        self.signal_name = signal_name
-        self.raw_value = None
-        self.enum_values = {}  # value -> name mapping
-        
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(4, 2, 4, 2)
-        
-        self.value_label = QLabel("---")
-        self.value_label.setStyleSheet("color: #58a6ff; font-weight: 600;")
-        layout.addWidget(self.value_label)
-        
-        self.enum_label = QLabel("")
-        self.enum_label.setStyleSheet("color: #8b949e; font-style: italic;")
-        layout.addWidget(self.enum_label)
-        
-        layout.addStretch()
-        
-    def set_enum_values(self, enum_dict):
-        """Set enumeration values for this signal"""
-        self.enum_values = enum_dict
-        
-    def update_value(self, raw_value, physical_value, unit=""):
-        """Update the displayed value"""
-        self.raw_value = raw_value
-        
-        # Format physical value
-        if isinstance(physical_value, float):
-            value_str = f"{physical_value:.3f}"
-        else:
-            value_str = str(physical_value)
-            
-        if unit:
-            value_str += f" {unit}"
-            
-        self.value_label.setText(value_str)
+    Les cellules des signaux portent (valeur, énumération) dans Qt.UserRole;
+    les autres cellules (messages bruts) sont dessinées normalement.
+    """
+    
+    VALUE_COLOR = QColor("#58a6ff")
+    ENUM_COLOR = QColor("#8b949e")
+    
+    def paint(self, painter, option, index):
+        value = index.data(Qt.UserRole)
+        if value is None:
+            super().paint(painter, option, index)
+            return
         
-        # Check for enumeration
-        if self.enum_values and raw_value in self.enum_values:
-            enum_name = self.enum_values[raw_value]
-            self.enum_label.setText(f"[{enum_name}]")
-        else:
-            self.enum_label.setText("")
+        # Fond, sélection et survol selon le style courant
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, opt, painter, opt.widget)
+        
+        value_text, enum_text = value
+        rect = opt.rect.adjusted(4, 0, -4, 0)
+        painter.save()
+        
+        font = QFont(opt.font)
+        font.setWeight(QFont.DemiBold)
+        painter.setFont(font)
+        painter.setPen(self.VALUE_COLOR)
+        painter.drawText(rect, Qt.AlignLeft | Qt.AlignVCenter, value_text)
+        
+        if enum_text:
+            rect.setLeft(rect.left() + painter.fontMetrics().horizontalAdvance(value_text) + 6)
+            font = QFont(opt.font)
+            font.setItalic(True)
+            painter.setFont(font)
+            painter.setPen(self.ENUM_COLOR)
+            painter.drawText(rect, Qt.AlignLeft | Qt.AlignVCenter, enum_text)
+        
+        painter.restore()
+
+
+def make_signal_formatter(signal):
+    """Choisir une fois, au chargement, le formatage des valeurs d'un signal
+    
+    Returns:
+        Fonction (raw_value, physical_value) -> (valeur, énumération)
+    """
+    suffix = f" {signal.unit}" if signal.unit else ""
+    choices = getattr(signal, 'choices', None)
+    
+    if choices:
+        # Valeur nommée ou numérique selon la trame: type vérifié à chaque fois
+        def format_value(raw_value, physical_value):
+            if isinstance(physical_value, float):
+                value_str = f"{physical_value:.3f}{suffix}"
+            else:
+                value_str = f"{physical_value}{suffix}"
+            enum_name = choices.get(raw_value)
+            return value_str, (f"[{enum_name}]" if enum_name is not None else "")
+        return format_value
+    
+    # cantools ne renvoie un float que si le signal est flottant ou mis à l'échelle par un float
+    is_float = (getattr(signal, 'is_float', False)
+                or isinstance(signal.scale, float) or isinstance(signal.offset, float))
+    template = ("{:.3f}" if is_float else "{}") + suffix.replace("{", "{{").replace("}", "}}")
+    template_format = template.format
+    return lambda raw_value, physical_value: (template_format(physical_value), "")
+
+
+class TreeNode:
+    """Ligne du modèle: message (parent None) ou signal"""
+    
+    __slots__ = ('parent', 'row', 'texts', 'payload', 'value', 'children', 'search_text')
+    
+    def __init__(self, parent, row, texts, payload):
+        self.parent = parent
+        self.row = row
+        self.texts = texts  # Texte affiché par colonne
+        self.payload = payload  # Données de la colonne 0 (Qt.UserRole)
+        self.value = None  # (valeur, énumération) peints par SignalValueDelegate
+        self.children = []
+        self.search_text = (texts[0] + " " + texts[1]).lower()
+
+
+class MessageTreeModel(QAbstractItemModel):
+    """Modèle messages / signaux stocké dans des listes Python
+    
+    Les messages sont à la racine, leurs signaux en enfants. Chaque index
+    pointe sur son TreeNode.
+    """
+    
+    COLUMN_COUNT = 4
+    MESSAGE_COLOR = QColor("#58a6ff")
+    RAW_MESSAGE_COLOR = QColor("#d29922")  # Orange pour les messages non décodés
+    SIGNAL_COLOR = QColor("#8b949e")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.headers = ["▼ Message / Signal", "ID", "Valeur", "Unité"]
+        self.messages = []  # TreeNode par message, dans l'ordre d'insertion
+        self.bold_font = QFont()
+        self.bold_font.setBold(True)
+        
+    def load_messages(self, messages):
+        """Remplacer le contenu par les messages d'une base
+        
+        Returns:
+            Dictionnaire (message_name, signal_name) -> TreeNode du signal
+        """
+        signal_nodes = {}
+        self.beginResetModel()
+        self.messages = []
+        for message in messages:
+            msg_node = TreeNode(None, len(self.messages),
+                                [message.name, f"0x{message.frame_id:03X}", "", ""],
+                                {"type": "message", "message": message})
+            for signal in message.signals:
+                sig_node = TreeNode(msg_node, len(msg_node.children),
+                                    [f"  └─ {signal.name}", "", "", signal.unit or ""],
+                                    {"type": "signal", "message": message, "signal": signal})
+                sig_node.value = ("---", "")
+                msg_node.children.append(sig_node)
+                signal_nodes[(message.name, signal.name)] = sig_node
+            self.messages.append(msg_node)
+        self.endResetModel()
+        return signal_nodes
+    
+    def clear(self):
+        """Supprimer toutes les lignes"""
+        self.beginResetModel()
+        self.messages = []
+        self.endResetModel()
+    
+    def add_raw_message(self, can_id, data_text, time_text):
+        """Ajouter un message brut (sans DBC) à la racine et retourner son noeud"""
+        row = len(self.messages)
+        node = TreeNode(None, row, [f"Unknown_0x{can_id:03X}", f"0x{can_id:03X}",
+                                    data_text, time_text],
+                        {"type": "raw_message", "can_id": can_id})
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.messages.append(node)
+        self.endInsertRows()
+        return node
+    
+    def set_raw_data(self, node, data_text, time_text):
+        """Mettre à jour les données et l'horodatage d'un message brut"""
+        node.texts[2] = data_text
+        node.texts[3] = time_text
+        self.dataChanged.emit(self.createIndex(node.row, 2, node),
+                              self.createIndex(node.row, 3, node), [Qt.DisplayRole])
+    
+    def set_signal_values(self, updates):
+        """Mettre à jour des valeurs de signaux
+        
+        Un seul dataChanged est émis par message, couvrant ses lignes modifiées.
+        
+        Args:
+            updates: Itérable de (TreeNode du signal, (valeur, énumération))
+        """
+        rows_by_parent = {}
+        for node, value in updates:
+            node.value = value
+            rows = rows_by_parent.get(node.parent)
+            if rows is None:
+                rows_by_parent[node.parent] = [node.row, node.row]
+            elif node.row < rows[0]:
+                rows[0] = node.row
+            elif node.row > rows[1]:
+                rows[1] = node.row
+        
+        for parent, (first, last) in rows_by_parent.items():
+            self.dataChanged.emit(self.createIndex(first, 2, parent.children[first]),
+                                  self.createIndex(last, 2, parent.children[last]),
+                                  [Qt.UserRole])
+    
+    def set_header_text(self, column, text):
+        """Changer le texte d'une colonne de l'en-tête"""
+        self.headers[column] = text
+        self.headerDataChanged.emit(Qt.Horizontal, column, column)
+    
+    def node(self, row, parent):
+        """TreeNode de la ligne row sous l'index parent"""
+        if parent.isValid():
+            return parent.internalPointer().children[row]
+        return self.messages[row]
+    
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self.node(row, parent))
+    
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.messages)
+        if parent.column() != 0:
+            return 0
+        return len(parent.internalPointer().children)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return self.COLUMN_COUNT
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            return node.texts[column]
+        if role == Qt.UserRole:
+            if column == 0:
+                return node.payload
+            if column == 2:
+                return node.value
+            return None
+        if column == 0:
+            if role == Qt.ForegroundRole:
+                if node.parent is not None:
+                    return self.SIGNAL_COLOR
+                if node.payload["type"] == "raw_message":
+                    return self.RAW_MESSAGE_COLOR
+                return self.MESSAGE_COLOR
+            if role == Qt.FontRole and node.parent is None:
+                return self.bold_font
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.headers[section]
+        return None
+
+
+class MessageFilterProxyModel(QSortFilterProxyModel):
+    """Tri et recherche sur MessageTreeModel
+    
+    Un message correspondant à la recherche garde tous ses signaux; sinon il
+    n'est affiché qu'avec ses signaux correspondants.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.search_text = ""
+        
+    def set_search_text(self, text):
+        """Filtrer sur un texte (insensible à la casse)"""
+        self.search_text = text.lower()
+        self.invalidateFilter()
+        
+    def filterAcceptsRow(self, source_row, source_parent):
+        text = self.search_text
+        if not text:
+            return True
+        node = self.sourceModel().node(source_row, source_parent)
+        if node.parent is not None:
+            return text in node.parent.search_text or text in node.search_text
+        return (text in node.search_text
+                or any(text in child.search_text for child in node.children))
 
 
 class MessageBrowser(QWidget):
@@ -66,20 +288,20 @@ class MessageBrowser(QWidget):
     signal_selected = pyqtSignal(str, str)  # message_name, signal_name
     message_selected = pyqtSignal(str)  # message_name
     
+    UPDATE_DELAY_MS = 50  # Latest display update after a value changes
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.db = None
         self.current_values = {}  # (message_name, signal_name) -> (raw, physical, unit)
-        self.signal_widgets = {}  # (message_name, signal_name) -> SignalValueWidget
-        self.raw_messages = {}  # can_id -> (data, timestamp, item)
+        self.signal_nodes = {}  # (message_name, signal_name) -> TreeNode
+        self.signal_formatters = {}  # (message_name, signal_name) -> make_signal_formatter()
+        self.raw_messages = {}  # can_id -> (data, timestamp, node)
+        self._dirty = set()  # Keys of current_values changed since the last display update
+        self._update_pending = False  # update_display already scheduled
         
         self.init_ui()
         
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(100)  # 10 Hz
-        
     def init_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -109,10 +331,14 @@ class MessageBrowser(QWidget):
         # Splitter pour messages et détails
         splitter = QSplitter(Qt.Horizontal)
         
-        # Tree widget pour les messages
-        self.tree = QTreeWidget()
+        # Arbre des messages: modèle -> proxy (tri, recherche) -> vue
+        self.model = MessageTreeModel(self)
+        self.proxy = MessageFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.tree = QTreeView()
+        self.tree.setModel(self.proxy)
+        self.tree.setUniformRowHeights(True)
         self.all_collapsed = False
-        self.tree.setHeaderLabels(["▼ Message / Signal", "ID", "Valeur", "Unité"])
         self.tree.setColumnWidth(0, 250)
         self.tree.setColumnWidth(1, 100)
         self.tree.setColumnWidth(2, 150)
@@ -121,7 +347,9 @@ class MessageBrowser(QWidget):
         self.tree.header().setSectionsClickable(True)
         self.tree.header().setSortIndicatorShown(True)
         self.tree.sortByColumn(1, Qt.AscendingOrder)  # Tri par défaut
-        self.tree.itemClicked.connect(self.on_item_clicked)
+        self.value_delegate = SignalValueDelegate(self.tree)
+        self.tree.setItemDelegateForColumn(2, self.value_delegate)
+        self.tree.clicked.connect(self.on_item_clicked)
         
         # Connect header click for column 0 to toggle expand/collapse
         self.tree.header().sectionClicked.connect(self.on_header_clicked)
@@ -158,101 +386,94 @@ class MessageBrowser(QWidget):
     def load_database(self, db):
         """Load database and populate tree"""
         self.db = db
-        self.tree.clear()
-        self.signal_widgets.clear()
+        self.signal_formatters.clear()
         self.raw_messages.clear()  # Clear raw messages when loading new DB
+        # Values already received are shown again on the next update
+        self._dirty = set(self.current_values)
+        if self._dirty:
+            self._schedule_update()
         
         if not db:
+            self.model.clear()
+            self.signal_nodes = {}
             return
             
         # Sort messages by CAN ID
         messages = sorted(db.messages, key=lambda m: m.frame_id)
         
+        # Value formatting (type, unit, enumerations) resolved once per signal
         for message in messages:
-            # Message item
-            msg_item = QTreeWidgetItem(self.tree)
-            msg_item.setText(0, message.name)
-            msg_item.setText(1, f"0x{message.frame_id:03X}")
-            msg_item.setData(0, Qt.UserRole, {"type": "message", "message": message})
-            
-            # Style message
-            font = QFont()
-            font.setBold(True)
-            msg_item.setFont(0, font)
-            msg_item.setForeground(0, QColor("#58a6ff"))
-            
-            # Add signals
             for signal in message.signals:
-                sig_item = QTreeWidgetItem(msg_item)
-                sig_item.setText(0, f"  └─ {signal.name}")
-                sig_item.setText(3, signal.unit or "")
-                sig_item.setData(0, Qt.UserRole, {
-                    "type": "signal",
-                    "message": message,
-                    "signal": signal
-                })
-                
-                # Create value widget
-                value_widget = SignalValueWidget(signal.name)
-                
-                # Set enumeration if available
-                if hasattr(signal, 'choices') and signal.choices:
-                    value_widget.set_enum_values(signal.choices)
-                    
-                self.tree.setItemWidget(sig_item, 2, value_widget)
-                self.signal_widgets[(message.name, signal.name)] = value_widget
-                
-                # Signal info
-                sig_item.setForeground(0, QColor("#8b949e"))
-                
-        self.tree.expandAll()
+                self.signal_formatters[(message.name, signal.name)] = make_signal_formatter(signal)
+        
+        # The model is filled in a single reset (one proxy sort); repaint
+        # the view only once it is expanded
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.signal_nodes = self.model.load_messages(messages)
+            self.tree.expandAll()
+        finally:
+            self.tree.setUpdatesEnabled(True)
         
     def add_raw_message(self, can_id, data, timestamp):
         """Add or update a raw CAN message (no DBC)"""
         import time
         
+        data_str = " ".join(f"{b:02X}" for b in data)
+        time_str = f"{time.time():.3f}"
+        
         # Check if message already exists
         if can_id in self.raw_messages:
             # Update existing
-            _, _, item = self.raw_messages[can_id]
-            data_str = " ".join(f"{b:02X}" for b in data)
-            item.setText(2, data_str)
-            item.setText(3, f"{time.time():.3f}")
-            self.raw_messages[can_id] = (data, timestamp, item)
+            _, _, node = self.raw_messages[can_id]
+            self.model.set_raw_data(node, data_str, time_str)
         else:
-            # Create new raw message item
-            msg_item = QTreeWidgetItem(self.tree)
-            msg_name = f"Unknown_0x{can_id:03X}"
-            msg_item.setText(0, msg_name)
-            msg_item.setText(1, f"0x{can_id:03X}")
-            data_str = " ".join(f"{b:02X}" for b in data)
-            msg_item.setText(2, data_str)
-            msg_item.setText(3, f"{time.time():.3f}")
-            msg_item.setData(0, Qt.UserRole, {"type": "raw_message", "can_id": can_id})
-            
-            # Style raw message differently
-            font = QFont()
-            font.setBold(True)
-            msg_item.setFont(0, font)
-            msg_item.setForeground(0, QColor("#d29922"))  # Orange for undecoded
-            
-            self.raw_messages[can_id] = (data, timestamp, msg_item)
+            # Create new raw message row
+            node = self.model.add_raw_message(can_id, data_str, time_str)
+        self.raw_messages[can_id] = (data, timestamp, node)
     
     def update_signal_value(self, message_name, signal_name, raw_value, physical_value, unit=""):
         """Update a signal's value"""
         key = (message_name, signal_name)
-        self.current_values[key] = (raw_value, physical_value, unit)
+        value = (raw_value, physical_value, unit)
+        if self.current_values.get(key) == value:
+            return
+        self.current_values[key] = value
+        self._dirty.add(key)
+        self._schedule_update()
+    
+    def _schedule_update(self):
+        """Coalesce value changes into one display update"""
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(self.UPDATE_DELAY_MS, self.update_display)
         
     def update_display(self):
-        """Update all displayed values"""
-        for key, widget in self.signal_widgets.items():
-            if key in self.current_values:
-                raw, physical, unit = self.current_values[key]
-                widget.update_value(raw, physical, unit)
+        """Update the displayed values that changed since the last update"""
+        self._update_pending = False
+        dirty = self._dirty
+        if not dirty:
+            return
+        self._dirty = set()
+        
+        nodes = self.signal_nodes
+        formatters = self.signal_formatters
+        current_values = self.current_values
+        updates = []
+        for key in dirty:
+            node = nodes.get(key)
+            if node is None:
+                continue
+            raw, physical, _ = current_values[key]
+            value = formatters[key](raw, physical)
+            if value != node.value:
+                updates.append((node, value))
+        if updates:
+            self.model.set_signal_values(updates)
                 
-    def on_item_clicked(self, item, column):
+    def on_item_clicked(self, index):
         """Handle item click"""
-        data = item.data(0, Qt.UserRole)
+        data = index.sibling(index.row(), 0).data(Qt.UserRole)
         if not data:
             return
             
@@ -364,43 +585,17 @@ class MessageBrowser(QWidget):
         """Toggle collapse/expand all items"""
         self.all_collapsed = not self.all_collapsed
         
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            if self.all_collapsed:
-                item.setExpanded(False)
-            else:
-                item.setExpanded(True)
-        
         # Update header text
         if self.all_collapsed:
-            self.tree.headerItem().setText(0, "▶ Message / Signal")
+            self.tree.collapseAll()
+            self.model.set_header_text(0, "▶ Message / Signal")
         else:
-            self.tree.headerItem().setText(0, "▼ Message / Signal")
+            self.tree.expandAll()
+            self.model.set_header_text(0, "▼ Message / Signal")
     
     def filter_messages(self, text):
         """Filter messages/signals by search text"""
-        text = text.lower()
-        
-        for i in range(self.tree.topLevelItemCount()):
-            msg_item = self.tree.topLevelItem(i)
-            msg_visible = False
-            
-            # Check message name
-            if text in msg_item.text(0).lower() or text in msg_item.text(1).lower():
-                msg_visible = True
-                # Show all signals
-                for j in range(msg_item.childCount()):
-                    msg_item.child(j).setHidden(False)
-            else:
-                # Check signals
-                for j in range(msg_item.childCount()):
-                    sig_item = msg_item.child(j)
-                    sig_visible = text in sig_item.text(0).lower()
-                    sig_item.setHidden(not sig_visible)
-                    if sig_visible:
-                        msg_visible = True
-                        
-            msg_item.setHidden(not msg_visible)
+        self.proxy.set_search_text(text)
             
     def sort_messages(self, sort_type):
         """Sort messages by different criteria"""
@@ -14,11 +14,15 @@ import numpy as np
 class PlotWidget(QWidget):
     """Widget for real-time signal plotting."""
     
+    MAX_POINTS = 10000  # Samples kept per curve, same as the signal processor
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.signals = []
         self.plots = {}
         self.curves = {}
+        self.plot_times: Dict[str, np.ndarray] = {}
+        self.plot_values: Dict[str, np.ndarray] = {}
         # Modern, harmonious color palette
         self.colors = [
             '#58a6ff',  # Blue
@@ -107,6 +111,8 @@ class PlotWidget(QWidget):
             signal_names: List of signal names
         """
         self.signals = signal_names
+        self.plot_times.clear()
+        self.plot_values.clear()
         self.setup_plots()
         
     def setup_plots(self):
@@ -202,6 +208,16 @@ class PlotWidget(QWidget):
                 
                 self.plots[signal_name] = plot
                 self.curves[signal_name] = curve
+        
+        # Let pyqtgraph decimate dense curves to the view width (keeping
+        # min/max per pixel) and skip points outside the visible range
+        for plot in set(self.plots.values()):
+            plot.setDownsampling(auto=True, mode='peak')
+            plot.setClipToView(True)
+        
+        # Redraw the data collected so far on the new curves
+        for signal_name, times in self.plot_times.items():
+            self.update_plot(signal_name, times, self.plot_values[signal_name])
     
     def update_plot(self, signal_name: str, times: np.ndarray, values: np.ndarray):
         """
@@ -215,18 +231,53 @@ class PlotWidget(QWidget):
         if signal_name not in self.curves:
             return
         
-        # Apply time window filter
+        self._set_curve_data(signal_name, times, values, self._time_window())
+    
+    def _time_window(self):
+        """Selected time window in seconds, or None for all data."""
         time_window_text = self.time_window_combo.currentText()
-        if time_window_text != 'All' and len(times) > 0:
-            window_seconds = float(time_window_text.rstrip('s'))
-            current_time = times[-1]
-            mask = times >= (current_time - window_seconds)
-            times = times[mask]
-            values = values[mask]
-        
-        # Update curve
+        if time_window_text == 'All':
+            return None
+        return float(time_window_text.rstrip('s'))
+    
+    def _set_curve_data(self, signal_name: str, times: np.ndarray, values: np.ndarray,
+                        window_seconds):
+        """Apply the time window and push the data to the curve."""
+        if window_seconds is not None and len(times) > 0:
+            # Timestamps are increasing, so the window starts at a single index
+            start = np.searchsorted(times, times[-1] - window_seconds)
+            times = times[start:]
+            values = values[start:]
+        
         self.curves[signal_name].setData(times, values)
     
+    def append_plots(self, signal_names: List[str], times_list: List[np.ndarray],
+                     values_list: List[np.ndarray]):
+        """
+        Append new samples to several curves in one call.
+        
+        Args:
+            signal_names: Names of the signals
+            times_list: Time array of the new samples, per signal
+            values_list: Value array of the new samples, per signal
+        """
+        window_seconds = self._time_window()
+        curves = self.curves
+        plot_times = self.plot_times
+        plot_values = self.plot_values
+        
+        for signal_name, times, values in zip(signal_names, times_list, values_list):
+            if signal_name not in curves or len(times) == 0:
+                continue
+            
+            if signal_name in plot_times:
+                times = np.concatenate((plot_times[signal_name], times))[-self.MAX_POINTS:]
+                values = np.concatenate((plot_values[signal_name], values))[-self.MAX_POINTS:]
+            plot_times[signal_name] = times
+            plot_values[signal_name] = values
+            
+            self._set_curve_data(signal_name, times, values, window_seconds)
+    
     def change_plot_mode(self, mode: str):
         """Change plot layout mode."""
         self.setup_plots()
@@ -285,5 +336,7 @@ class PlotWidget(QWidget):
     
     def clear_all(self):
         """Clear all plot data."""
+        self.plot_times.clear()
+        self.plot_values.clear()
         for curve in self.curves.values():
             curve.setData([], [])
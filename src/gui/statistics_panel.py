@@ -7,6 +7,7 @@ Panel for displaying signal statistics.
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
                              QPushButton, QHBoxLayout, QLabel, QComboBox)
 from PyQt5.QtCore import Qt
+from typing import Iterable, Optional
 from src.data_processing.signal_processor import SignalProcessor
 
 
@@ -16,6 +17,7 @@ class StatisticsPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.signals = []
+        self.signal_rows = {}
         self.init_ui()
         
     def init_ui(self):
@@ -44,20 +46,28 @@ class StatisticsPanel(QWidget):
     def set_signals(self, signal_names: list):
         """Set the signals to display statistics for."""
         self.signals = signal_names
+        self.signal_rows = {name: i for i, name in enumerate(signal_names)}
         self.table.setRowCount(len(signal_names))
         
         for i, signal_name in enumerate(signal_names):
             self.table.setItem(i, 0, QTableWidgetItem(signal_name))
     
-    def update_statistics(self, signal_processor: SignalProcessor):
-        """Update statistics display."""
+    def update_statistics(self, signal_processor: SignalProcessor,
+                          signal_names: Optional[Iterable[str]] = None):
+        """Update statistics display (only for signal_names if given)."""
         window_text = self.window_combo.currentText()
         window_size = None
         
         if window_text != 'All':
             window_size = int(window_text.split()[0])
         
-        for i, signal_name in enumerate(self.signals):
+        if signal_names is None:
+            signal_names = self.signals
+        
+        for signal_name in signal_names:
+            i = self.signal_rows.get(signal_name)
+            if i is None:
+                continue
             stats = signal_processor.get_statistics(signal_name, window_size)
             
             self.table.setItem(i, 1, QTableWidgetItem(f"{stats['mean']:.3f}"))
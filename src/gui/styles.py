@@ -386,6 +386,24 @@ QStatusBar QLabel {
     color: #8b949e;
 }
 
+QLabel#statusLabel {
+    padding: 4px 12px;
+}
+
+#msgCounter QLabel {
+    padding: 4px 2px;
+    font-weight: bold;
+}
+
+QLabel#statusLabel[state="connected"] {
+    color: #4caf50;
+    font-weight: bold;
+}
+
+QLabel#statusLabel[state="disconnected"] {
+    color: #f44336;
+}
+
 /* Dock Widget */
 QDockWidget {
     titlebar-close-icon: url(none);
@@ -646,6 +664,24 @@ QStatusBar {
     color: #212121;
     border-top: 1px solid #e0e0e0;
 }
+
+QLabel#statusLabel {
+    padding: 4px 12px;
+}
+
+#msgCounter QLabel {
+    padding: 4px 2px;
+    font-weight: bold;
+}
+
+QLabel#statusLabel[state="connected"] {
+    color: #4caf50;
+    font-weight: bold;
+}
+
+QLabel#statusLabel[state="disconnected"] {
+    color: #f44336;
+}
 """
 
 
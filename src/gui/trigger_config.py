@@ -114,7 +114,7 @@ class TriggerConfigWidget(QWidget):
         trigger = self.trigger_manager.get_trigger(trigger_name)
         
         if trigger:
-            trigger.set_enabled(not trigger.enabled)
+            self.trigger_manager.enable_trigger(trigger_name, not trigger.enabled)
             self.refresh_trigger_list()
     
     def refresh_trigger_list(self):
@@ -11,12 +11,23 @@ from pathlib import Path
 from typing import Optional, Dict, List
 from PyQt5.QtCore import QObject, pyqtSignal
 import logging
+import threading
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
 
 class DataRecorder(QObject):
-    """Records CAN data to CSV files."""
+    """Records CAN data to CSV files.
+    
+    Rows are queued by the caller and written by a dedicated writer thread,
+    so slow disks never stall message processing. Starting and stopping is
+    serialized by a lock.
+    """
+    
+    QUEUE_SIZE = 65536  # Rows buffered before the oldest are dropped
+    WRITE_INTERVAL = 0.01  # Seconds between writer wake-ups
+    WRITE_CHUNK = 256  # Rows that wake the writer early
     
     # Signals
     recording_started = pyqtSignal(str)  # file_path
@@ -30,8 +41,13 @@ class DataRecorder(QObject):
         self.csv_file = None
         self.csv_writer = None
         self.message_count = 0
+        self.dropped_count = 0  # Rows lost because the writer fell behind
         self.recording_mode = 'raw'  # 'raw' or 'decoded'
         self.selected_signals: List[str] = []
+        self._lock = threading.RLock()
+        self._queue = deque(maxlen=self.QUEUE_SIZE)
+        self._wakeup = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
         
     def start_recording(self, output_dir: str = 'recordings', 
                        filename: Optional[str] = None,
@@ -63,26 +79,35 @@ class DataRecorder(QObject):
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 filename = f"can_recording_{timestamp}.csv"
             
-            self.file_path = output_path / filename
-            self.recording_mode = mode
-            self.selected_signals = selected_signals or []
-            
-            # Open CSV file
-            self.csv_file = open(self.file_path, 'w', newline='')
-            self.csv_writer = csv.writer(self.csv_file)
-            
-            # Write header based on mode
-            if mode == 'raw':
-                self.csv_writer.writerow([
-                    'Timestamp', 'ID', 'ID_Hex', 'DLC', 'Data', 'Extended', 'Error'
-                ])
-            else:  # decoded mode
-                header = ['Timestamp', 'Message_ID', 'Message_Name']
-                header.extend(self.selected_signals)
-                self.csv_writer.writerow(header)
-            
-            self.message_count = 0
-            self.is_recording = True
+            with self._lock:
+                self.file_path = output_path / filename
+                self.recording_mode = mode
+                self.selected_signals = selected_signals or []
+                
+                # Open CSV file
+                self.csv_file = open(self.file_path, 'w', newline='')
+                self.csv_writer = csv.writer(self.csv_file)
+                
+                # Write header based on mode
+                if mode == 'raw':
+                    self.csv_writer.writerow([
+                        'Timestamp', 'ID', 'ID_Hex', 'DLC', 'Data', 'Extended', 'Error'
+                    ])
+                else:  # decoded mode
+                    header = ['Timestamp', 'Message_ID', 'Message_Name']
+                    header.extend(self.selected_signals)
+                    self.csv_writer.writerow(header)
+                
+                self.message_count = 0
+                self.dropped_count = 0
+                self._queue.clear()
+                self._wakeup.clear()
+                self.is_recording = True
+                
+                self._writer_thread = threading.Thread(target=self._write_loop,
+                                                       name='DataRecorderWriter',
+                                                       daemon=True)
+                self._writer_thread.start()
             
             logger.info(f"Started recording to {self.file_path}")
             self.recording_started.emit(str(self.file_path))
@@ -101,14 +126,24 @@ class DataRecorder(QObject):
             return
         
         try:
-            if self.csv_file:
-                self.csv_file.close()
-                self.csv_file = None
-                self.csv_writer = None
-            
-            self.is_recording = False
+            with self._lock:
+                # Let the writer flush the queue and exit before closing
+                self.is_recording = False
+                self._wakeup.set()
+                if self._writer_thread is not None:
+                    self._writer_thread.join()
+                    self._writer_thread = None
+                # Rows queued by a caller that checked is_recording just before it changed
+                self._write_queued()
+                
+                if self.csv_file:
+                    self.csv_file.close()
+                    self.csv_file = None
+                    self.csv_writer = None
             
             logger.info(f"Stopped recording. Total messages: {self.message_count}")
+            if self.dropped_count:
+                logger.warning(f"Dropped {self.dropped_count} rows while the writer fell behind")
             self.recording_stopped.emit(self.message_count)
             
         except Exception as e:
@@ -127,24 +162,16 @@ class DataRecorder(QObject):
         if not self.is_recording or self.recording_mode != 'raw':
             return
         
-        try:
-            ts = timestamp if timestamp is not None else msg.timestamp
-            data_hex = msg.data.hex().upper()
-            
-            self.csv_writer.writerow([
-                ts,
-                msg.arbitration_id,
-                f"0x{msg.arbitration_id:X}",
-                msg.dlc,
-                data_hex,
-                msg.is_extended_id,
-                msg.is_error_frame
-            ])
-            
-            self.message_count += 1
-            
-        except Exception as e:
-            logger.error(f"Error recording message: {str(e)}")
+        ts = timestamp if timestamp is not None else msg.timestamp
+        self._enqueue([
+            ts,
+            msg.arbitration_id,
+            f"0x{msg.arbitration_id:X}",
+            msg.dlc,
+            msg.data.hex().upper(),
+            msg.is_extended_id,
+            msg.is_error_frame
+        ])
     
     def record_decoded_message(self, timestamp: float, msg_id: int, 
                                msg_name: str, signals: Dict[str, float]):
@@ -160,19 +187,61 @@ class DataRecorder(QObject):
         if not self.is_recording or self.recording_mode != 'decoded':
             return
         
+        row = [timestamp, msg_id, msg_name]
+        
+        # Add signal values in the order specified
+        for signal_name in self.selected_signals:
+            value = signals.get(signal_name, '')
+            row.append(value)
+        
+        self._enqueue(row)
+    
+    def record_decoded_row(self, timestamp: float, msg_id: int, msg_name: str,
+                           values: List):
+        """
+        Record decoded signal values already ordered like selected_signals.
+        
+        Args:
+            timestamp: Message timestamp
+            msg_id: CAN message ID
+            msg_name: Message name
+            values: One value per selected signal ('' when not in this message)
+        """
+        if not self.is_recording or self.recording_mode != 'decoded':
+            return
+        
+        self._enqueue([timestamp, msg_id, msg_name, *values])
+    
+    def _enqueue(self, row: list):
+        """Queue a row for the writer thread, dropping the oldest when full."""
+        queue = self._queue
+        if len(queue) >= self.QUEUE_SIZE:
+            self.dropped_count += 1
+        queue.append(row)
+        if len(queue) >= self.WRITE_CHUNK:
+            self._wakeup.set()
+    
+    def _write_queued(self):
+        """Write the queued rows; message_count counts the rows actually written."""
+        queue = self._queue
+        if not queue:
+            return
+        rows = [queue.popleft() for _ in range(len(queue))]
         try:
-            row = [timestamp, msg_id, msg_name]
-            
-            # Add signal values in the order specified
-            for signal_name in self.selected_signals:
-                value = signals.get(signal_name, '')
-                row.append(value)
-            
-            self.csv_writer.writerow(row)
-            self.message_count += 1
-            
+            self.csv_writer.writerows(rows)
+            self.message_count += len(rows)
         except Exception as e:
-            logger.error(f"Error recording decoded message: {str(e)}")
+            logger.error(f"Error recording message: {str(e)}")
+    
+    def _write_loop(self):
+        """Writer thread: drain queued rows to the CSV file until recording stops."""
+        while True:
+            self._wakeup.wait(self.WRITE_INTERVAL)
+            self._wakeup.clear()
+            stopping = not self.is_recording
+            self._write_queued()
+            if stopping:
+                return
     
     def get_status(self) -> Dict:
         """
@@ -185,5 +254,6 @@ class DataRecorder(QObject):
             'is_recording': self.is_recording,
             'file_path': str(self.file_path) if self.file_path else None,
             'message_count': self.message_count,
+            'dropped_count': self.dropped_count,
             'mode': self.recording_mode
         }
@@ -7,7 +7,9 @@ Implements complex trigger conditions for data capture and actions.
 from typing import Dict, List, Callable, Any, Optional
 from enum import Enum
 from PyQt5.QtCore import QObject, pyqtSignal
+import numpy as np
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,8 @@ class TriggerAction(Enum):
 class TriggerCondition:
     """Represents a single trigger condition."""
     
+    __slots__ = ('signal_name', 'condition_type', 'threshold', 'last_value')
+    
     def __init__(self, signal_name: str, condition_type: TriggerConditionType, 
                  threshold: Optional[float] = None):
         """
@@ -138,12 +142,13 @@ class Trigger(QObject):
         """Add an action to perform when triggered."""
         self.actions.append(action)
     
-    def evaluate(self, signal_values: Dict[str, float]) -> bool:
+    def evaluate(self, latest: np.ndarray, signal_index: Dict[str, int]) -> bool:
         """
         Evaluate all conditions with current signal values.
         
         Args:
-            signal_values: Dictionary of signal names to current values
+            latest: Latest value per signal id (NaN until first received)
+            signal_index: Dictionary of signal names to ids in `latest`
             
         Returns:
             bool: True if trigger conditions are met
@@ -157,11 +162,12 @@ class Trigger(QObject):
         # Evaluate each condition
         results = []
         for condition in self.conditions:
-            signal_value = signal_values.get(condition.signal_name)
-            if signal_value is None:
+            idx = signal_index.get(condition.signal_name)
+            signal_value = latest[idx] if idx is not None else np.nan
+            if np.isnan(signal_value):
                 results.append(False)
             else:
-                results.append(condition.evaluate(signal_value))
+                results.append(condition.evaluate(float(signal_value)))
         
         # Combine results based on logic
         if self.logic == TriggerLogic.AND:
@@ -173,6 +179,8 @@ class Trigger(QObject):
             self.trigger_count += 1
             if self.single_shot:
                 self.armed = False
+            signal_values = {name: float(latest[idx]) for name, idx in signal_index.items()
+                             if not np.isnan(latest[idx])}
             self.triggered.emit(self.name, signal_values)
             logger.debug(f"Trigger '{self.name}' fired (count: {self.trigger_count})")
         
@@ -196,7 +204,11 @@ class Trigger(QObject):
 
 
 class TriggerManager(QObject):
-    """Manages multiple triggers."""
+    """Manages multiple triggers.
+    
+    Triggers may be evaluated from a worker thread while they are edited
+    from the GUI; the trigger table is guarded by a lock.
+    """
     
     # Signals
     trigger_fired = pyqtSignal(str, dict)  # (trigger_name, signal_values)
@@ -204,38 +216,87 @@ class TriggerManager(QObject):
     def __init__(self):
         super().__init__()
         self.triggers: Dict[str, Trigger] = {}
+        self.signal_index: Dict[str, int] = {}
+        # Fast-path state for the CAN worker: number of triggers that can fire
+        # and a bitmask (bit = signal id) of the signals they depend on
+        self.armed_count = 0
+        self.signal_mask = 0
+        self._watched: List[tuple] = []  # (trigger, signal mask) of armed triggers
+        self._lock = threading.RLock()
         
     def add_trigger(self, trigger: Trigger):
         """Add a trigger to the manager."""
-        self.triggers[trigger.name] = trigger
+        with self._lock:
+            self.triggers[trigger.name] = trigger
+            self._update_watch()
         trigger.triggered.connect(self._on_trigger_fired)
         logger.info(f"Added trigger: {trigger}")
     
     def remove_trigger(self, name: str):
         """Remove a trigger by name."""
-        if name in self.triggers:
+        with self._lock:
+            if name not in self.triggers:
+                return
             del self.triggers[name]
-            logger.info(f"Removed trigger: {name}")
+            self._update_watch()
+        logger.info(f"Removed trigger: {name}")
     
-    def evaluate_all(self, signal_values: Dict[str, float]):
+    def set_signal_index(self, signal_index: Dict[str, int]):
+        """Set the signal name -> id mapping used to read the value array."""
+        with self._lock:
+            self.signal_index = dict(signal_index)
+            self._update_watch()
+    
+    def _update_watch(self):
+        """Recompute armed_count and signal_mask (called with the lock held)."""
+        watched = []
+        signal_mask = 0
+        for trigger in self.triggers.values():
+            if not (trigger.enabled and trigger.armed and trigger.conditions):
+                continue
+            trigger_mask = 0
+            for condition in trigger.conditions:
+                idx = self.signal_index.get(condition.signal_name)
+                if idx is not None:
+                    trigger_mask |= 1 << idx
+            watched.append((trigger, trigger_mask))
+            signal_mask |= trigger_mask
+        self._watched = watched
+        self.armed_count = len(watched)
+        self.signal_mask = signal_mask
+    
+    def evaluate_all(self, latest: np.ndarray, changed_mask: int = -1):
         """
-        Evaluate all triggers with current signal values.
+        Evaluate the armed triggers that depend on a changed signal.
         
         Args:
-            signal_values: Dictionary of signal names to current values
+            latest: Latest value per signal id, as set by set_signal_index
+            changed_mask: Bitmask of the signal ids that changed (all by default)
         """
-        for trigger in self.triggers.values():
-            trigger.evaluate(signal_values)
+        with self._lock:
+            disarmed = False
+            for trigger, trigger_mask in self._watched:
+                if not trigger_mask & changed_mask:
+                    continue
+                if trigger.evaluate(latest, self.signal_index) and not trigger.armed:
+                    disarmed = True
+            if disarmed:
+                # A single-shot trigger fired
+                self._update_watch()
     
     def reset_all(self):
         """Reset all triggers."""
-        for trigger in self.triggers.values():
-            trigger.reset()
+        with self._lock:
+            for trigger in self.triggers.values():
+                trigger.reset()
+            self._update_watch()
     
     def enable_trigger(self, name: str, enabled: bool = True):
         """Enable or disable a specific trigger."""
-        if name in self.triggers:
-            self.triggers[name].set_enabled(enabled)
+        with self._lock:
+            if name in self.triggers:
+                self.triggers[name].set_enabled(enabled)
+                self._update_watch()
     
     def get_trigger(self, name: str) -> Optional[Trigger]:
         """Get a trigger by name."""
@@ -243,7 +304,8 @@ class TriggerManager(QObject):
     
     def get_all_triggers(self) -> List[Trigger]:
         """Get list of all triggers."""
-        return list(self.triggers.values())
+        with self._lock:
+            return list(self.triggers.values())
     
     def _on_trigger_fired(self, name: str, signal_values: dict):
         """Internal handler for trigger events."""
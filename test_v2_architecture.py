@@ -19,7 +19,7 @@ def test_imports():
         return False
         
     try:
-        from src.gui.message_browser import MessageBrowser, SignalValueWidget
+        from src.gui.message_browser import MessageBrowser, MessageTreeModel, SignalValueDelegate
         print("✅ message_browser imported successfully")
     except Exception as e:
         print(f"❌ message_browser import failed: {e}")
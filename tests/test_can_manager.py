@@ -2,7 +2,6 @@
 Example test for CAN interface manager.
 """
 
-import pytest
 from src.can_interface.can_manager import CANInterfaceManager
 
 
@@ -18,3 +17,62 @@ def test_get_available_interfaces():
     interfaces = CANInterfaceManager.get_available_interfaces()
     assert isinstance(interfaces, dict)
     assert 'virtual' in interfaces  # Virtual should always be available
+
+
+def _wait_for(predicate, timeout=2.0):
+    """Poll until predicate() is true or the timeout expires."""
+    import time
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_rx_listener_added_before_connect():
+    """Test a listener registered before connect receives frames."""
+    import can
+    received = []
+    manager = CANInterfaceManager()
+    manager.add_rx_listener(received.append)
+    assert manager._rx_listeners == [received.append]
+    
+    assert manager.connect('virtual', 'rx_before')
+    try:
+        assert received.append in manager.notifier.listeners
+        with can.Bus(interface='virtual', channel='rx_before') as sender:
+            sender.send(can.Message(arbitration_id=0x123, data=[1, 2, 3], is_extended_id=False))
+            assert _wait_for(lambda: len(received) == 1)
+        assert received[0].arbitration_id == 0x123
+    finally:
+        manager.disconnect()
+
+
+def test_rx_listener_added_and_removed_after_connect():
+    """Test listeners can be attached to and detached from a running notifier."""
+    import can
+    received = []
+    kept = []
+    manager = CANInterfaceManager()
+    assert manager.connect('virtual', 'rx_after')
+    try:
+        manager.add_rx_listener(received.append)
+        manager.add_rx_listener(kept.append)
+        assert received.append in manager.notifier.listeners
+        
+        with can.Bus(interface='virtual', channel='rx_after') as sender:
+            sender.send(can.Message(arbitration_id=0x100, data=[1], is_extended_id=False))
+            assert _wait_for(lambda: len(received) == 1 and len(kept) == 1)
+            
+            manager.remove_rx_listener(received.append)
+            assert manager._rx_listeners == [kept.append]
+            assert received.append not in manager.notifier.listeners
+            
+            sender.send(can.Message(arbitration_id=0x101, data=[2], is_extended_id=False))
+            assert _wait_for(lambda: len(kept) == 2)
+        assert len(received) == 1
+        
+        # Removing an unknown listener is a no-op
+        manager.remove_rx_listener(received.append)
+        assert manager._rx_listeners == [kept.append]
+    finally:
+        manager.disconnect()
@@ -0,0 +1,52 @@
+"""
+Tests for the data recorder writer thread.
+"""
+
+import csv
+import can
+from src.recorder.data_recorder import DataRecorder
+
+
+def _read_rows(path):
+    with open(path, newline='') as f:
+        return list(csv.reader(f))
+
+
+def test_stop_flushes_all_decoded_rows(tmp_path):
+    """Test every queued decoded row is written before the file is closed."""
+    recorder = DataRecorder()
+    stopped = []
+    recorder.recording_stopped.connect(stopped.append)
+    assert recorder.start_recording(output_dir=str(tmp_path), filename='decoded.csv',
+                                    mode='decoded', selected_signals=['speed', 'rpm'])
+    
+    for i in range(1000):
+        recorder.record_decoded_row(i / 100.0, 0x100, 'Engine', [i, ''])
+    recorder.stop_recording()
+    
+    rows = _read_rows(tmp_path / 'decoded.csv')
+    assert rows[0] == ['Timestamp', 'Message_ID', 'Message_Name', 'speed', 'rpm']
+    assert len(rows) == 1001
+    assert rows[-1] == ['9.99', '256', 'Engine', '999', '']
+    assert recorder.message_count == 1000
+    assert stopped == [1000]
+
+
+def test_stop_flushes_all_raw_rows(tmp_path):
+    """Test raw frames queued just before stopping are written."""
+    recorder = DataRecorder()
+    assert recorder.start_recording(output_dir=str(tmp_path), filename='raw.csv')
+    
+    msg = can.Message(arbitration_id=0x123, data=[1, 2, 3], is_extended_id=False)
+    for i in range(10):
+        recorder.record_raw_message(msg, timestamp=float(i))
+    recorder.stop_recording()
+    
+    rows = _read_rows(tmp_path / 'raw.csv')
+    assert len(rows) == 11
+    assert rows[1][:5] == ['0.0', '291', '0x123', '3', '010203']
+    assert recorder.message_count == 10
+    
+    # Rows arriving after the stop are not recorded
+    recorder.record_raw_message(msg, timestamp=10.0)
+    assert len(_read_rows(tmp_path / 'raw.csv')) == 11
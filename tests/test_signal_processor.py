@@ -0,0 +1,96 @@
+"""
+Tests for the signal processor ring buffers.
+"""
+
+import numpy as np
+from src.data_processing.signal_processor import SignalProcessor
+
+
+def _add(processor, name, start, stop):
+    """Add samples value=i, timestamp=i/10 for i in [start, stop)."""
+    for i in range(start, stop):
+        processor.add_sample(name, float(i), i / 10.0)
+
+
+def test_get_data_since_returns_only_new_samples():
+    """Test incremental reads return the tail added since the last call."""
+    processor = SignalProcessor(max_samples=10)
+    _add(processor, 'speed', 0, 4)
+    
+    times, values, end = processor.get_data_since('speed', 0)
+    assert list(values) == [0, 1, 2, 3]
+    assert np.allclose(times, [0.0, 0.1, 0.2, 0.3])
+    assert end == 4
+    
+    _add(processor, 'speed', 4, 7)
+    times, values, end = processor.get_data_since('speed', end)
+    assert list(values) == [4, 5, 6]
+    assert end == 7
+    
+    times, values, end = processor.get_data_since('speed', end)
+    assert len(values) == 0
+    assert end == 7
+
+
+def test_ring_buffer_wraps_past_max_samples():
+    """Test the buffer keeps the newest max_samples in time order."""
+    processor = SignalProcessor(max_samples=5)
+    _add(processor, 'speed', 0, 12)
+    
+    times, values = processor.get_data('speed')
+    assert list(values) == [7, 8, 9, 10, 11]
+    assert np.allclose(times, [0.7, 0.8, 0.9, 1.0, 1.1])
+    assert processor.get_sample_count('speed') == 5
+    
+    # A tail that straddles the end of the buffer
+    times, values, end = processor.get_data_since('speed', 9)
+    assert list(values) == [9, 10, 11]
+    assert end == 12
+    
+    # A caller left behind by more than the buffer gets what is still held
+    times, values, end = processor.get_data_since('speed', 2)
+    assert list(values) == [7, 8, 9, 10, 11]
+    
+    stats = processor.get_statistics('speed', window_size=2)
+    assert stats['samples'] == 2
+    assert stats['mean'] == 10.5
+
+
+def test_clear_signal_keeps_sample_index_monotonic():
+    """Test clearing a signal drops its data but not the running index."""
+    processor = SignalProcessor(max_samples=5)
+    _add(processor, 'speed', 0, 3)
+    _add(processor, 'rpm', 0, 2)
+    
+    processor.clear_signal('speed')
+    times, values = processor.get_data('speed')
+    assert len(values) == 0
+    assert processor.get_sample_count('speed') == 0
+    assert processor.get_sample_count('rpm') == 2
+    
+    _add(processor, 'speed', 3, 5)
+    times, values, end = processor.get_data_since('speed', 3)
+    assert list(values) == [3, 4]
+    assert end == 5
+    
+    # An index from before the clear gets only what is held now
+    times, values, end = processor.get_data_since('speed', 0)
+    assert list(values) == [3, 4]
+
+
+def test_clear_all():
+    """Test clearing all signals."""
+    processor = SignalProcessor(max_samples=5)
+    _add(processor, 'speed', 0, 8)
+    
+    processor.clear_all()
+    assert processor.get_signal_names() == []
+    times, values, end = processor.get_data_since('speed', 8)
+    assert len(values) == 0
+    assert end == 8
+    
+    _add(processor, 'speed', 8, 10)
+    times, values, end = processor.get_data_since('speed', 8)
+    assert list(values) == [8, 9]
+    assert np.allclose(times, [0.8, 0.9])
+    assert end == 10
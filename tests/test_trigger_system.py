@@ -0,0 +1,100 @@
+"""
+Tests for the trigger manager fast-path state.
+"""
+
+import numpy as np
+from src.triggers.trigger_system import (Trigger, TriggerCondition, TriggerConditionType,
+                                         TriggerManager)
+
+
+def _trigger(name, signal_name, threshold, single_shot=False):
+    """Build a trigger firing when signal_name > threshold."""
+    trigger = Trigger(name)
+    trigger.add_condition(TriggerCondition(signal_name, TriggerConditionType.GREATER_THAN,
+                                           threshold))
+    trigger.single_shot = single_shot
+    return trigger
+
+
+def _manager():
+    manager = TriggerManager()
+    manager.set_signal_index({'speed': 0, 'rpm': 1, 'temp': 2})
+    return manager
+
+
+def test_mask_follows_add_and_remove():
+    """Test signal_mask/armed_count after adding and removing triggers."""
+    manager = _manager()
+    assert manager.armed_count == 0
+    assert manager.signal_mask == 0
+    
+    manager.add_trigger(_trigger('fast', 'speed', 100))
+    manager.add_trigger(_trigger('hot', 'temp', 90))
+    assert manager.armed_count == 2
+    assert manager.signal_mask == 0b101
+    
+    manager.remove_trigger('fast')
+    assert manager.armed_count == 1
+    assert manager.signal_mask == 0b100
+    
+    manager.remove_trigger('missing')
+    assert manager.armed_count == 1
+
+
+def test_mask_follows_enable():
+    """Test disabled triggers leave the watched set."""
+    manager = _manager()
+    manager.add_trigger(_trigger('fast', 'speed', 100))
+    manager.add_trigger(_trigger('revs', 'rpm', 5000))
+    
+    manager.enable_trigger('fast', False)
+    assert manager.armed_count == 1
+    assert manager.signal_mask == 0b010
+    
+    manager.enable_trigger('fast', True)
+    assert manager.armed_count == 2
+    assert manager.signal_mask == 0b011
+
+
+def test_single_shot_fire_disarms_until_reset():
+    """Test a single-shot trigger leaves the mask after firing and returns on reset_all."""
+    manager = _manager()
+    fired = []
+    manager.trigger_fired.connect(lambda name, values: fired.append(name))
+    manager.add_trigger(_trigger('once', 'speed', 100, single_shot=True))
+    manager.add_trigger(_trigger('hot', 'temp', 90))
+    
+    latest = np.array([50.0, np.nan, 20.0])
+    manager.evaluate_all(latest, 0b001)
+    assert fired == []
+    assert manager.armed_count == 2
+    
+    latest[0] = 150.0
+    manager.evaluate_all(latest, 0b001)
+    assert fired == ['once']
+    assert manager.armed_count == 1
+    assert manager.signal_mask == 0b100
+    
+    # Disarmed: no second fire
+    manager.evaluate_all(latest, -1)
+    assert fired == ['once']
+    
+    manager.reset_all()
+    assert manager.armed_count == 2
+    assert manager.signal_mask == 0b101
+    manager.evaluate_all(latest, 0b001)
+    assert fired == ['once', 'once']
+
+
+def test_evaluate_all_skips_triggers_on_unchanged_signals():
+    """Test only triggers overlapping the changed mask are evaluated."""
+    manager = _manager()
+    fired = []
+    manager.trigger_fired.connect(lambda name, values: fired.append(name))
+    manager.add_trigger(_trigger('fast', 'speed', 100))
+    
+    latest = np.array([150.0, 3000.0, np.nan])
+    manager.evaluate_all(latest, 0b010)
+    assert fired == []
+    manager.evaluate_all(latest, 0b011)
+    assert fired == ['fast']